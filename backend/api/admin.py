@@ -8,6 +8,8 @@ from .models import (
     GalleryImage,
     User,
     PasswordSetupToken,
+    OutboundEmail,
+    PendingS3Deletion,
 )
 
 
@@ -40,6 +42,11 @@ class UserAdmin(BaseUserAdmin):
     # Hide Django’s built-in staff flag since you don’t use it
     exclude = ("is_staff",)
 
+    # one by one, so User.delete() revokes each user's tokens (api.authentication)
+    def delete_queryset(self, request, queryset):
+        for user in queryset:
+            user.delete()
+
     # computed full name
     def get_full_name(self, obj):
         full = f"{obj.first_name} {obj.last_name}".strip()
@@ -164,3 +171,21 @@ class GalleryImageAdmin(admin.ModelAdmin):
     readonly_fields = ("created_at",)
     list_filter = ("type",)
     search_fields = ("title",)
+
+
+# ===============================
+# OUTBOUND EMAIL QUEUE
+# ===============================
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ("id", "subject", "recipients", "status", "attempts", "next_attempt_at", "sent_at", "created_at")
+    readonly_fields = ("created_at", "updated_at", "sent_at")
+    list_filter = ("status",)
+    search_fields = ("subject",)
+
+
+@admin.register(PendingS3Deletion)
+class PendingS3DeletionAdmin(admin.ModelAdmin):
+    list_display = ("id", "key", "attempts", "next_attempt_at", "created_at")
+    readonly_fields = ("created_at",)
+    search_fields = ("key",)
@@ -0,0 +1,90 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from .caching import (
+    REVOKED_USERS_KEY,
+    cache_timeout,
+    deleted_user_key,
+    deleted_user_timeout,
+    user_exists_key,
+)
+from .models import User
+
+
+# ======================================================
+# STATELESS JWT AUTH (no User query per request)
+# ======================================================
+# CustomTokenObtainPairSerializer.get_token puts user_id, username, email
+# and role in every token. Revocation is checked against the cache (see
+# "REVOKED USERS" in api.caching): one get_many per request, plus one
+# query to rebuild the inactive-id set after it expires or a user changes
+# and one existence query per user and AUTH_REVOKED_USERS_TTL.
+# settings.AUTH_REVOKED_USERS_TTL documents the latency.
+
+def load_revoked_user_ids():
+    # as strings: simplejwt puts str(user.pk) in the user_id claim
+    ids = frozenset(str(pk) for pk in User.objects.filter(is_active=False).values_list("id", flat=True))
+    cache.set(REVOKED_USERS_KEY, ids, timeout=cache_timeout(settings.AUTH_REVOKED_USERS_TTL))
+    return ids
+
+
+def user_exists(user_id):
+    """Confirmed in the database, then trusted for AUTH_REVOKED_USERS_TTL."""
+    if not User.objects.filter(pk=user_id).exists():
+        cache.set(deleted_user_key(user_id), True, deleted_user_timeout())
+        return False
+    cache.set(user_exists_key(user_id), True, cache_timeout(settings.AUTH_REVOKED_USERS_TTL))
+    return True
+
+
+def is_revoked(user_id):
+    """True if the user is inactive or has been deleted."""
+    deleted_key, exists_key = deleted_user_key(user_id), user_exists_key(user_id)
+    cached = cache.get_many([REVOKED_USERS_KEY, deleted_key, exists_key])
+    if cached.get(deleted_key):
+        return True
+
+    revoked = cached.get(REVOKED_USERS_KEY)
+    if revoked is None:
+        revoked = load_revoked_user_ids()
+    if str(user_id) in revoked:
+        return True
+    return not (cached.get(exists_key) or user_exists(user_id))
+
+
+class ClaimsUser(TokenUser):
+    """request.user built from the token claims; has no database row."""
+
+    @cached_property
+    def email(self):
+        return self.token.get("email", "")
+
+    @cached_property
+    def role(self):
+        return self.token.get("role")
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that returns a ClaimsUser instead of loading the
+    User row. Tokens without the custom claims (issued by older code)
+    still get the regular database lookup.
+    """
+
+    def get_user(self, validated_token):
+        if "role" not in validated_token:
+            return super().get_user(validated_token)
+
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        if is_revoked(user_id):
+            raise AuthenticationFailed("User is inactive or deleted", code="user_inactive")
+
+        return ClaimsUser(validated_token)
@@ -0,0 +1,84 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .caching import cache_timeout, get_version, model_namespace, record_cache_lookup
+from .models import Category, Event, GalleryImage
+
+
+# ======================================================
+# SITE BOOTSTRAP (GET /api/bootstrap/)
+# ======================================================
+# Everything the public pages render, in one pre-encoded JSON blob.
+# Field lists are trimmed to what the site uses.
+BOOTSTRAP_MODELS = (Event, Category, GalleryImage)
+BOOTSTRAP_NAMESPACE = "bootstrap"
+
+EVENT_FIELDS = (
+    "id",
+    "title",
+    "location",
+    "venue",
+    "start_date",
+    "end_date",
+    "time_schedule",
+    "exhibitors_count",
+    "buyers_count",
+    "countries_count",
+    "sectors_count",
+    "description",
+)
+CATEGORY_FIELDS = ("id", "name", "description", "icon", "image", "image_variants")
+GALLERY_FIELDS = ("id", "title", "description", "image", "image_variants", "display_order")
+GALLERY_TYPES = ("carousel", "banner")
+
+
+def build_bootstrap():
+    event = (
+        Event.objects.filter(is_active=True)
+        .order_by("start_date")
+        .values(*EVENT_FIELDS)
+        .first()
+    )
+    categories = list(Category.objects.order_by("-created_at").values(*CATEGORY_FIELDS))
+
+    gallery = {image_type: [] for image_type in GALLERY_TYPES}
+    rows = (
+        GalleryImage.objects.filter(type__in=GALLERY_TYPES)
+        .order_by("display_order", "-created_at")
+        .values("type", *GALLERY_FIELDS)
+    )
+    for row in rows:
+        gallery[row.pop("type")].append(row)
+
+    return {"event": event, "categories": categories, **gallery}
+
+
+def bootstrap_key():
+    """Changes whenever any of BOOTSTRAP_MODELS is written to."""
+    versions = ":".join(str(get_version(model_namespace(model))) for model in BOOTSTRAP_MODELS)
+    return f"{BOOTSTRAP_NAMESPACE}:{versions}"
+
+
+def site_bootstrap():
+    """
+    (encoded JSON, etag, cache hit) for the bootstrap payload. The blob is
+    rebuilt on the first request after a write to any of the models.
+    """
+    key = bootstrap_key()
+    cached = cache.get(key)
+    hit = cached is not None
+    record_cache_lookup(BOOTSTRAP_NAMESPACE, hit)
+
+    if cached is None:
+        blob = json.dumps(build_bootstrap(), cls=DjangoJSONEncoder, separators=(",", ":")).encode("utf-8")
+        # from the content, not the key: workers with their own version
+        # counters still agree on the ETag of identical data
+        cached = (blob, f'"{hashlib.md5(blob).hexdigest()}"')
+        cache.set(key, cached, cache_timeout(settings.RESPONSE_CACHE_TIMEOUT))
+
+    blob, etag = cached
+    return blob, etag, hit
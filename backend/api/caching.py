@@ -0,0 +1,165 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+from .metrics import CACHE_LOOKUPS
+
+
+# ======================================================
+# SHARED VS PROCESS-LOCAL BACKENDS
+# ======================================================
+# Version bumps only reach the workers that share the cache. With a
+# per-process backend (LocMem) another gunicorn worker keeps serving its
+# own copy, so every cached payload is capped at LOCAL_CACHE_MAX_TIMEOUT
+# seconds there. api.checks flags the setup.
+
+def cache_is_process_local():
+    return isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def cache_timeout(seconds):
+    """`seconds`, capped when invalidations cannot reach other workers."""
+    if cache_is_process_local():
+        return min(seconds, settings.LOCAL_CACHE_MAX_TIMEOUT)
+    return seconds
+
+
+# ======================================================
+# PER-MODEL VERSION COUNTERS
+# ======================================================
+# Every cached payload derived from a model embeds that model's current
+# version in its key. Writing to the model bumps the version, so stale
+# entries are simply never read again and expire on their own.
+
+def model_namespace(model):
+    return model._meta.label_lower
+
+
+def _version_key(namespace):
+    return f"version:{namespace}"
+
+
+def _seed_version():
+    # Seeded from the clock so an evicted counter never falls back to
+    # a value that older cached entries were written with.
+    return int(time.time() * 1000)
+
+
+def get_version(namespace):
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _seed_version(), timeout=None)
+        version = cache.get(key) or _seed_version()
+    return version
+
+
+def bump_version(namespace):
+    key = _version_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = _seed_version()
+        cache.set(key, version, timeout=None)
+        return version
+
+
+def versioned_key(namespace, *parts):
+    """
+    Build a cache key for `namespace` that changes whenever the
+    namespace version is bumped.
+    """
+    digest = hashlib.md5(repr(parts).encode("utf-8")).hexdigest()
+    return f"{namespace}:v{get_version(namespace)}:{digest}"
+
+
+def invalidate_model_cache(model):
+    """
+    Bump the version of `model` once the current transaction commits
+    (immediately under autocommit).
+    """
+    namespace = model_namespace(model)
+    transaction.on_commit(lambda: bump_version(namespace))
+
+
+# ======================================================
+# HIT / MISS COUNTERS
+# ======================================================
+# Kept in the cache itself so they add up across workers when the
+# cache backend is shared.
+CACHE_STATS_NAMESPACES_KEY = "cachestats:namespaces"
+
+
+def _counter_key(namespace, outcome):
+    return f"cachestats:{namespace}:{outcome}"
+
+
+def record_cache_lookup(namespace, hit):
+    CACHE_LOOKUPS.labels(namespace, "hit" if hit else "miss").inc()
+
+    key = _counter_key(namespace, "hits" if hit else "misses")
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+        namespaces = cache.get(CACHE_STATS_NAMESPACES_KEY, set())
+        if namespace not in namespaces:
+            cache.set(CACHE_STATS_NAMESPACES_KEY, namespaces | {namespace}, timeout=None)
+
+
+def cache_stats():
+    """{namespace: {"hits": n, "misses": n, "hit_ratio": float}}"""
+    stats = {}
+    for namespace in sorted(cache.get(CACHE_STATS_NAMESPACES_KEY, set())):
+        hits = cache.get(_counter_key(namespace, "hits"), 0)
+        misses = cache.get(_counter_key(namespace, "misses"), 0)
+        total = hits + misses
+        stats[namespace] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+        }
+    return stats
+
+
+# ======================================================
+# REVOKED USERS (stateless JWT auth, api.authentication)
+# ======================================================
+# Inactive user ids are cached as one set, rebuilt from the database.
+# Deleted users leave no row to rebuild from: each gets a marker for as
+# long as an access token lives, and every other id is confirmed to exist
+# at most once per AUTH_REVOKED_USERS_TTL, so a lost or per-process marker
+# still takes effect within that time.
+REVOKED_USERS_KEY = "auth:revoked-users"
+
+
+def deleted_user_key(user_id):
+    return f"auth:deleted-user:{user_id}"
+
+
+def user_exists_key(user_id):
+    return f"auth:user-exists:{user_id}"
+
+
+def forget_revoked_users():
+    """Drop the revoked set after commit; the next request rebuilds it."""
+    transaction.on_commit(lambda: cache.delete(REVOKED_USERS_KEY))
+
+
+def deleted_user_timeout():
+    """A deleted user's tokens are all expired after this long."""
+    return int(settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"].total_seconds())
+
+
+def mark_user_deleted(user_id):
+    def mark():
+        cache.set(deleted_user_key(user_id), True, deleted_user_timeout())
+        cache.delete(user_exists_key(user_id))
+
+    transaction.on_commit(mark)
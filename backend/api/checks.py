@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+from .caching import cache_is_process_local
+from .otp import get_otp_store
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """Cache invalidation only reaches workers that share the cache backend."""
+    if not cache_is_process_local():
+        return []
+
+    level = Warning if settings.DEBUG else Error
+    return [
+        level(
+            "The default cache is local to each process, so a write does not invalidate "
+            "the cached lists, stats, bootstrap blob or auth state of other workers, "
+            "and the cache hit / miss counters are per worker.",
+            hint=(
+                "Set CACHE_BACKEND to a shared backend (e.g. django.core.cache.backends.redis.RedisCache). "
+                f"Until then cached payloads are kept at most LOCAL_CACHE_MAX_TIMEOUT={settings.LOCAL_CACHE_MAX_TIMEOUT}s."
+            ),
+            id="api.W001" if settings.DEBUG else "api.E001",
+        )
+    ]
+
+
+@register()
+def check_otp_store(app_configs, **kwargs):
+    """Load OTP_STORE_BACKEND at startup rather than on the first send_otp."""
+    try:
+        get_otp_store()
+    except Exception as exc:
+        return [
+            Error(
+                f"OTP_STORE_BACKEND {settings.OTP_STORE_BACKEND!r} cannot be loaded: {exc}",
+                hint="Point it at an OTPStore subclass that implements issue(), check() and discard().",
+                id="api.E002",
+            )
+        ]
+    return []
+
+
+@register()
+def check_metrics_token(app_configs, **kwargs):
+    """/api/metrics/ refuses scrapes without a token when DEBUG is off."""
+    if settings.METRICS_TOKEN or settings.DEBUG:
+        return []
+    return [
+        Warning(
+            "METRICS_TOKEN is not set, so /api/metrics/ answers every scrape with 403.",
+            hint="Set METRICS_TOKEN and configure Prometheus to send it as a Bearer token.",
+            id="api.W002",
+        )
+    ]
@@ -0,0 +1,94 @@
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+
+# ======================================================
+# FAST READ PATH: .values() rows -> serializer-identical dicts
+# ======================================================
+# Fields whose to_representation() returns database values unchanged
+IDENTITY_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,  # also Email / URL / Slug
+    serializers.ChoiceField,
+    serializers.FloatField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+)
+
+
+def _datetime_converter(field):
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    field_timezone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+        return field.to_representation
+
+    def convert(value):
+        if value.tzinfo is None:
+            return field.to_representation(value)
+        text = value.astimezone(field_timezone).isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+    return convert
+
+
+def _date_converter(field):
+    output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+    return lambda value: value.isoformat()
+
+
+def _converter(field):
+    """
+    (supported, converter) for one serializer field. A None converter
+    means the value is passed through as is.
+    """
+    if isinstance(field, serializers.DateTimeField):
+        return True, _datetime_converter(field)
+    if isinstance(field, serializers.DateField):
+        return True, _date_converter(field)
+    if isinstance(field, serializers.JSONField):
+        return True, field.to_representation if field.binary else None
+    if isinstance(field, IDENTITY_FIELDS):
+        return True, None
+    return False, None
+
+
+class RowPlan:
+    """Precompiled (output name, column, converter) steps for one serializer."""
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.columns = {column for _, column, _ in steps}
+
+    def render(self, rows):
+        steps = self.steps
+        data = []
+        for row in rows:
+            item = {}
+            for name, column, convert in steps:
+                value = row[column]
+                item[name] = value if value is None or convert is None else convert(value)
+            data.append(item)
+        return data
+
+
+def compile_row_plan(serializer):
+    """
+    RowPlan reproducing `serializer`'s output from .values() rows, or None
+    when a field (or a custom to_representation) needs model instances.
+    """
+    if type(serializer).to_representation is not serializers.Serializer.to_representation:
+        return None
+    if serializer.model_columns() is None:
+        return None
+
+    steps = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        supported, convert = _converter(field)
+        if not supported:
+            return None
+        steps.append((name, field.source, convert))
+    return RowPlan(steps)
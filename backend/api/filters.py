@@ -0,0 +1,90 @@
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+
+# ======================================================
+# DATE RANGE (?date_from=YYYY-MM-DD&date_to=YYYY-MM-DD)
+# ======================================================
+def parse_date_param(params, name):
+    raw = params.get(name)
+    if not raw:
+        return None
+
+    try:
+        value = parse_date(raw)
+    except ValueError:
+        value = None
+
+    if value is None:
+        raise ValidationError({name: "Use the YYYY-MM-DD format"})
+    return value
+
+
+def parse_date_range(params):
+    date_from = parse_date_param(params, "date_from")
+    date_to = parse_date_param(params, "date_to")
+
+    if date_from and date_to and date_from > date_to:
+        raise ValidationError({"date_to": "date_to must not be before date_from"})
+
+    return date_from, date_to
+
+
+def filter_by_date_range(queryset, date_from=None, date_to=None, field="created_at"):
+    """
+    Both bounds are inclusive calendar days. They are converted to aware
+    datetimes so the filter stays a plain range over `field` (index friendly).
+    """
+    tz = timezone.get_current_timezone()
+
+    if date_from:
+        start = timezone.make_aware(datetime.combine(date_from, time.min), tz)
+        queryset = queryset.filter(**{f"{field}__gte": start})
+
+    if date_to:
+        end = timezone.make_aware(datetime.combine(date_to + timedelta(days=1), time.min), tz)
+        queryset = queryset.filter(**{f"{field}__lt": end})
+
+    return queryset
+
+
+# ======================================================
+# REGISTRATION FILTERS (?status= &category= + date range)
+# ======================================================
+def filter_registrations(queryset, params, category_field):
+    """
+    Shared by the registration list and export endpoints.
+    `category_field` is product_category (exhibitors) or industry_interest (visitors).
+    """
+    status = params.get("status")
+    if status:
+        statuses = {value for value, _ in queryset.model.STATUS_CHOICES}
+        if status not in statuses:
+            raise ValidationError({"status": f"Choose one of: {', '.join(sorted(statuses))}"})
+        queryset = queryset.filter(status=status)
+
+    category = params.get("category")
+    if category:
+        queryset = queryset.filter(**{category_field: category})
+
+    date_from, date_to = parse_date_range(params)
+    return filter_by_date_range(queryset, date_from, date_to)
+
+
+def filter_gallery(queryset, params):
+    """?type=carousel or ?type=carousel,banner on the gallery list."""
+    requested = [value for value in params.get("type", "").split(",") if value]
+    if not requested:
+        return queryset
+
+    types = {value for value, _ in queryset.model.TYPE_CHOICES}
+    unknown = set(requested) - types
+    if unknown:
+        raise ValidationError({"type": f"Choose from: {', '.join(sorted(types))}"})
+
+    if len(requested) == 1:
+        return queryset.filter(type=requested[0])
+    return queryset.filter(type__in=requested)
@@ -0,0 +1,108 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from .utils import get_s3_client
+
+
+# ======================================================
+# READINESS PROBES (cached per worker, hard timeout)
+# ======================================================
+# Load balancer probes arrive every few seconds on every worker. Each
+# dependency is checked at most once per HEALTH_CHECK_CACHE_SECONDS, in
+# its own single background thread, so a hung database costs one stuck
+# probe per worker instead of one new connection attempt per request.
+
+def _check_db():
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    finally:
+        # probe threads live outside the request cycle; do not keep it open
+        connection.close()
+
+
+def _check_cache():
+    cache.set("health:probe", 1, timeout=30)
+    if cache.get("health:probe") != 1:
+        raise RuntimeError("cache did not return the probe value")
+
+
+def _check_s3():
+    get_s3_client().head_bucket(Bucket=settings.AWS_STORAGE_BUCKET_NAME)
+
+
+class Probe:
+    """One dependency check: cached result, one in-flight run at a time."""
+
+    def __init__(self, name, check):
+        self.name = name
+        self.check = check
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self._future = None
+        self._result = None
+        self._checked_at = 0.0
+
+    def _submit(self):
+        if self._executor is None or self._pid != os.getpid():
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"health-{self.name}")
+            self._pid = os.getpid()
+            self._future = None
+        self._future = self._executor.submit(self._timed_check)
+        return self._future
+
+    def _timed_check(self):
+        started = time.perf_counter()
+        self.check()
+        return (time.perf_counter() - started) * 1000
+
+    def run(self):
+        """{"status", "latency_ms" | "error", "age_seconds"} - cached or fresh."""
+        with self._lock:
+            now = time.monotonic()
+            if self._result is None or now - self._checked_at >= settings.HEALTH_CHECK_CACHE_SECONDS:
+                self._result = self._probe()
+                self._checked_at = time.monotonic()
+            return {**self._result, "age_seconds": round(time.monotonic() - self._checked_at, 2)}
+
+    def _probe(self):
+        timeout = settings.HEALTH_CHECK_TIMEOUT
+        if self._future is not None and not self._future.done() and self._pid == os.getpid():
+            # the previous check is still hanging; do not stack another one
+            return {"status": "error", "error": f"previous check still running (> {timeout}s)"}
+
+        future = self._submit()
+        try:
+            latency = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return {"status": "error", "error": f"timed out after {timeout}s"}
+        except Exception as e:
+            return {"status": "error", "error": str(e) or type(e).__name__}
+        return {"status": "ok", "latency_ms": round(latency, 2)}
+
+
+PROBES = {
+    "db": Probe("db", _check_db),
+    "cache": Probe("cache", _check_cache),
+    "s3": Probe("s3", _check_s3),
+}
+
+
+def readiness():
+    """(all ok, {dependency: result}) for the probes enabled in settings."""
+    names = ["db"]
+    if settings.HEALTH_CHECK_CACHE_BACKEND:
+        names.append("cache")
+    if settings.HEALTH_CHECK_S3:
+        names.append("s3")
+
+    checks = {name: PROBES[name].run() for name in names}
+    return all(check["status"] == "ok" for check in checks.values()), checks
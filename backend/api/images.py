@@ -0,0 +1,70 @@
+"""
+Pillow helpers for resized image variants.
+
+Kept free of Django imports so `render_variants` can run in a spawned
+worker process (see api.utils.store_image).
+"""
+from io import BytesIO
+
+from PIL import Image, ImageOps, features
+
+CONTENT_TYPES = {
+    "WEBP": "image/webp",
+    "AVIF": "image/avif",
+    "JPEG": "image/jpeg",
+}
+
+EXTENSIONS = {
+    "WEBP": "webp",
+    "AVIF": "avif",
+    "JPEG": "jpg",
+}
+
+_FEATURE_NAMES = {
+    "WEBP": "webp",
+    "AVIF": "avif",
+}
+
+
+def resolve_format(preferred):
+    """`preferred` if this Pillow build can encode it, JPEG otherwise."""
+    preferred = preferred.upper()
+    feature = _FEATURE_NAMES.get(preferred)
+    if preferred == "JPEG" or (feature and features.check(feature)):
+        return preferred
+    return "JPEG"
+
+
+def render_variants(data, widths, image_format="WEBP", quality=80):
+    """
+    Resize the encoded image in `data` to each width in `widths` (never
+    upscaling) and return [(width, encoded bytes), ...].
+    Returns [] when `data` is not an image Pillow can read.
+    """
+    try:
+        source = Image.open(BytesIO(data))
+        source.load()
+    except (OSError, Image.DecompressionBombError):
+        return []
+
+    with source:
+        image = ImageOps.exif_transpose(source)
+        if image_format == "JPEG":
+            image = image.convert("RGB")
+        elif image.mode not in ("RGB", "RGBA"):
+            has_alpha = "A" in image.mode or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+        variants = []
+        for width in sorted(set(widths)):
+            if width >= image.width:
+                continue
+
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+
+            buffer = BytesIO()
+            resized.save(buffer, format=image_format, quality=quality)
+            variants.append((width, buffer.getvalue()))
+
+        return variants
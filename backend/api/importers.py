@@ -0,0 +1,179 @@
+import csv
+import io
+
+from django.conf import settings
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError as DjangoValidationError
+from django.db import transaction
+from rest_framework import serializers
+
+from .caching import invalidate_model_cache
+from .models import ExhibitorRegistration, VisitorRegistration
+from .serializers import clean_email_address, clean_phone_number
+
+
+# ======================================================
+# BULK REGISTRATION IMPORT (CSV)
+# ======================================================
+# kind -> (model, importable columns, phone column, phone label)
+IMPORT_KINDS = {
+    "exhibitors": (
+        ExhibitorRegistration,
+        (
+            "company_name",
+            "contact_person_name",
+            "designation",
+            "email_address",
+            "contact_number",
+            "product_category",
+            "company_address",
+            "status",
+        ),
+        "contact_number",
+        "Contact number",
+    ),
+    "visitors": (
+        VisitorRegistration,
+        (
+            "first_name",
+            "last_name",
+            "company_name",
+            "email_address",
+            "phone_number",
+            "industry_interest",
+            "status",
+        ),
+        "phone_number",
+        "Phone number",
+    ),
+}
+
+
+def _error_text(exc, field=NON_FIELD_ERRORS):
+    """{field: [message, ...]}; errors without a field are filed under `field`."""
+    if isinstance(exc, DjangoValidationError):
+        if hasattr(exc, "error_dict"):
+            return {name: [str(m) for m in errors] for name, errors in exc.message_dict.items()}
+        return {field: exc.messages}
+    if isinstance(exc.detail, dict):
+        return exc.detail
+    return {field: [str(m) for m in exc.detail]}
+
+
+class RegistrationImporter:
+    """
+    Validates CSV rows with the serializer rules, drops rows whose email
+    already exists (one IN lookup per batch) and inserts the rest with
+    bulk_create, one transaction per batch.
+    """
+
+    def __init__(self, kind, batch_size=None):
+        self.model, self.columns, self.phone_field, self.phone_label = IMPORT_KINDS[kind]
+        self.batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        self.max_reported = settings.IMPORT_MAX_REPORTED_ERRORS
+
+        self.created = 0
+        self.rejected_count = 0
+        self.rejected = []
+        self._seen_emails = set()
+        self._batch = []
+
+    # ------------------------------
+    # public
+    # ------------------------------
+    def run(self, rows):
+        """`rows` is an iterable of dicts (e.g. csv.DictReader); header is line 1."""
+        for line, row in enumerate(rows, start=2):
+            instance = self._build(line, row)
+            if instance is not None:
+                self._batch.append((line, instance))
+            if len(self._batch) >= self.batch_size:
+                self._flush()
+        self._flush()
+
+        if self.created:
+            invalidate_model_cache(self.model)
+        return self.report()
+
+    def report(self):
+        return {
+            "created": self.created,
+            "rejected": self.rejected_count,
+            "errors": sorted(self.rejected, key=lambda error: error["line"]),
+            "errors_truncated": self.rejected_count > len(self.rejected),
+        }
+
+    # ------------------------------
+    # internals
+    # ------------------------------
+    def _reject(self, line, errors):
+        self.rejected_count += 1
+        if len(self.rejected) < self.max_reported:
+            self.rejected.append({"line": line, "errors": errors})
+
+    def _build(self, line, row):
+        values = {
+            column: (row.get(column) or "").strip()
+            for column in self.columns
+        }
+        if not values["status"]:
+            values["status"] = "pending"
+
+        field = "email_address"
+        try:
+            values["email_address"] = clean_email_address(values["email_address"])
+            field = self.phone_field
+            clean_phone_number(values[self.phone_field], label=self.phone_label)
+
+            field = NON_FIELD_ERRORS
+            instance = self.model(**values)
+            instance.full_clean(exclude=["created_at", "updated_at"], validate_unique=False, validate_constraints=False)
+        except (serializers.ValidationError, DjangoValidationError) as exc:
+            self._reject(line, _error_text(exc, field))
+            return None
+
+        return instance
+
+    def _flush(self):
+        if not self._batch:
+            return
+
+        batch, self._batch = self._batch, []
+        emails = {instance.email_address for _, instance in batch}
+
+        # duplicate check and insert share one transaction
+        with transaction.atomic():
+            existing = set(
+                self.model.objects
+                .filter(email_address__in=emails)
+                .values_list("email_address", flat=True)
+            )
+
+            to_create = []
+            for line, instance in batch:
+                email = instance.email_address
+                if email in existing or email in self._seen_emails:
+                    self._reject(line, {"email_address": ["Duplicate email address"]})
+                    continue
+                self._seen_emails.add(email)
+                to_create.append(instance)
+
+            self.model.objects.bulk_create(to_create, batch_size=self.batch_size)
+        self.created += len(to_create)
+
+
+def import_registrations_csv(kind, binary_file, batch_size=None):
+    """Stream a CSV upload / file opened in binary mode through the importer."""
+    importer = RegistrationImporter(kind, batch_size)
+    text = io.TextIOWrapper(binary_file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        missing = [
+            column for column in importer.columns
+            if column != "status" and column not in (reader.fieldnames or [])
+        ]
+        if missing:
+            raise serializers.ValidationError({"file": f"Missing columns: {', '.join(missing)}"})
+        return importer.run(reader)
+    finally:
+        # leave the underlying file to its owner
+        text.detach()
@@ -0,0 +1,143 @@
+import smtplib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .metrics import EMAILS, record_emails
+from .models import OutboundEmail
+from .timing import timed
+
+
+# A claimed batch is due again after this long, in case its worker died
+CLAIM_TIMEOUT = timedelta(minutes=15)
+
+
+# ======================================================
+# OUTBOX: enqueue in the request, send from the worker
+# ======================================================
+def queue_email(subject, body, recipients, from_email=None):
+    """
+    Store a message for the `send_queued_email` worker instead of talking
+    to SMTP inside the request.
+    """
+    email = OutboundEmail.objects.create(
+        subject=subject,
+        body=body,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients=list(recipients),
+    )
+    EMAILS.labels("queued").inc()
+    return email
+
+
+def retry_delay(attempts):
+    """Exponential backoff: base, 2x base, 4x base ... capped."""
+    delay = settings.EMAIL_RETRY_BASE_DELAY * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(delay, settings.EMAIL_RETRY_MAX_DELAY))
+
+
+def _mark_failed_attempt(email, error, now):
+    email.attempts += 1
+    email.last_error = str(error)[:2000]
+    # every recipient rejected by the server: retrying will not help
+    permanent = isinstance(error, smtplib.SMTPRecipientsRefused)
+    if permanent or email.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+        email.status = OutboundEmail.STATUS_FAILED
+    else:
+        email.next_attempt_at = now + retry_delay(email.attempts)
+
+
+def claim_due_emails(batch_size):
+    """
+    Lock up to `batch_size` due messages with SKIP LOCKED (PostgreSQL),
+    push them CLAIM_TIMEOUT into the future and commit. No other worker
+    picks them up while this one talks to SMTP.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            OutboundEmail.objects
+            .select_for_update(skip_locked=True)
+            .filter(status=OutboundEmail.STATUS_PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        for email in batch:
+            email.next_attempt_at = now + CLAIM_TIMEOUT
+        OutboundEmail.objects.bulk_update(batch, ["next_attempt_at"])
+    return batch
+
+
+def _record(email):
+    email.save(update_fields=["status", "attempts", "last_error", "next_attempt_at", "sent_at", "updated_at"])
+
+
+def send_queued_emails(batch_size=None, backend=None):
+    """
+    Send one batch of due messages over a single connection of `backend`
+    (EMAIL_BACKEND by default). Returns {"sent": n, "retrying": n, "failed": n}.
+
+    The batch is claimed and committed first, so SMTP runs without an open
+    transaction or row locks; each outcome is saved as soon as it is known.
+    """
+    counts = {"sent": 0, "retrying": 0, "failed": 0}
+    batch = claim_due_emails(batch_size or settings.EMAIL_QUEUE_BATCH_SIZE)
+    if not batch:
+        return counts
+
+    connection = get_connection(backend, fail_silently=False)
+    try:
+        with timed("smtp"):
+            connection.open()
+    except Exception as exc:
+        for email in batch:
+            _mark_failed_attempt(email, exc, timezone.now())
+            _record(email)
+    else:
+        handled = set()
+        try:
+            for email in batch:
+                message = EmailMessage(
+                    email.subject,
+                    email.body,
+                    email.from_email,
+                    email.recipients,
+                    connection=connection,
+                )
+                try:
+                    with timed("smtp"):
+                        connection.send_messages([message])
+                except Exception as exc:
+                    _mark_failed_attempt(email, exc, timezone.now())
+                    _record(email)
+                    handled.add(email.pk)
+                    # the session may be unusable now; start a fresh one
+                    connection.close()
+                    connection.open()
+                else:
+                    email.attempts += 1
+                    email.status = OutboundEmail.STATUS_SENT
+                    email.sent_at = timezone.now()
+                    email.last_error = ""
+                    _record(email)
+                    handled.add(email.pk)
+        except Exception as exc:
+            # reconnect failed: back off the rest of the batch
+            for email in batch:
+                if email.pk not in handled:
+                    _mark_failed_attempt(email, exc, timezone.now())
+                    _record(email)
+        finally:
+            connection.close()
+
+    for email in batch:
+        if email.status == OutboundEmail.STATUS_SENT:
+            counts["sent"] += 1
+        elif email.status == OutboundEmail.STATUS_FAILED:
+            counts["failed"] += 1
+        else:
+            counts["retrying"] += 1
+    record_emails(counts)
+    return counts
@@ -0,0 +1,470 @@
+import gc
+import json
+import platform
+import time
+import tracemalloc
+import uuid
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLResolver, resolve
+from django.utils import timezone
+
+from api import urls as api_urls
+from api.caching import bump_version, model_namespace
+from api.models import (
+    Category,
+    Event,
+    ExhibitorRegistration,
+    GalleryImage,
+    PasswordSetupToken,
+    User,
+    VisitorRegistration,
+)
+from api.otp import get_otp_store
+from api.utils import create_tokens_for_user
+
+BENCH_PASSWORD = "bench-pass-123"
+
+# routes that need a real bucket (object uploads / HEAD checks)
+S3_ROUTES = {
+    "gallery-batch-upload",
+    "categories-confirm-upload",
+    "gallery-confirm-upload",
+}
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def route_keys():
+    """Every route in api/urls.py: its name, or its pattern when unnamed."""
+    def walk(patterns, prefix=""):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                yield from walk(pattern.url_patterns, prefix + str(pattern.pattern))
+            elif "format" not in str(pattern.pattern):
+                yield pattern.name or prefix + str(pattern.pattern)
+
+    return set(walk(api_urls.urlpatterns))
+
+
+def route_key(path):
+    match = resolve(path.split("?")[0])
+    return match.url_name or match.route
+
+
+class Fixtures:
+    """Sample rows and per-iteration setup used by the scenarios."""
+
+    def __init__(self, admin):
+        self.admin = admin
+        self.run_id = uuid.uuid4().hex[:8]
+        self.exhibitor = ExhibitorRegistration.objects.order_by("-id").first()
+        self.visitor = VisitorRegistration.objects.order_by("-id").first()
+        self.event = Event.objects.order_by("-id").first()
+        self.category = Category.objects.order_by("-id").first()
+        self.gallery = GalleryImage.objects.order_by("-id").first()
+        if not all((self.exhibitor, self.visitor, self.event, self.category, self.gallery)):
+            raise CommandError("No data to benchmark against: run `python manage.py seed_data` first")
+
+    def email(self, label, i):
+        return f"bench-{label}-{self.run_id}-{i}@example.com"
+
+    def exhibitor_body(self, i):
+        return {
+            "company_name": f"Bench {i}",
+            "contact_person_name": "Bench",
+            "designation": "Owner",
+            "email_address": self.email("exhibitor", i),
+            "contact_number": "9876543210",
+            "product_category": "Textiles",
+            "company_address": "1 Bench Road",
+        }
+
+    def visitor_body(self, i):
+        return {
+            "first_name": "Bench",
+            "last_name": str(i),
+            "company_name": "Bench Co",
+            "email_address": self.email("visitor", i),
+            "phone_number": "9876543210",
+            "industry_interest": "Textiles",
+        }
+
+    def team_user(self, i, label):
+        return User.objects.create(
+            username=f"bench_{label}_{self.run_id}_{i}",
+            email=self.email(label, i),
+            role="sales",
+            is_active=False,
+        )
+
+    def invite(self, i, label, otp=None):
+        user = self.team_user(i, label)
+        token = PasswordSetupToken.objects.create(user=user)
+        if otp:
+            get_otp_store().issue(user.email, otp)
+        return user.email, str(token.token)
+
+    def otp_body(self, i):
+        email, _ = self.invite(i, "verify", otp="123456")
+        return {"email": email, "otp": "123456"}
+
+    def send_otp_body(self, i):
+        email, token = self.invite(i, "sendotp")
+        return {"email": email, "token": token}
+
+    def create_password_body(self, i):
+        email, token = self.invite(i, "password", otp="654321")
+        return {
+            "email": email,
+            "otp": "654321",
+            "token": token,
+            "password": BENCH_PASSWORD,
+            "username": f"bench_set_{self.run_id}_{i}",
+        }
+
+    def import_body(self, row_factory):
+        """Body factory: a 100 row CSV built from `row_factory` payloads."""
+        def body(i):
+            rows = [row_factory(i * 1000 + n) for n in range(100)]
+            lines = [",".join(rows[0])] + [",".join(row.values()) for row in rows]
+            return {"file": _NamedBytes(f"import-{i}.csv", "\n".join(lines).encode("utf-8"))}
+        return body
+
+    def gallery_row(self, i):
+        return GalleryImage.objects.create(title=f"Bench {i}", description="Bench", type="gallery")
+
+
+class _NamedBytes:
+    """Minimal file object for multipart test client uploads."""
+
+    def __init__(self, name, data):
+        self.name = name
+        self._data = data
+
+    def read(self, *args):
+        data, self._data = self._data, b""
+        return data
+
+
+def scenarios(fx):
+    """
+    (name, method, path, body, options) for every benchmarked route.
+    `path` / `body` may be callables taking the iteration number;
+    they run before the timer starts.
+    """
+    e, v, ev, cat, g = fx.exhibitor.pk, fx.visitor.pk, fx.event.pk, fx.category.pk, fx.gallery.pk
+    admin = {"auth": True}
+    public = {"auth": False}
+    write = {"auth": True, "write": True}
+    public_write = {"auth": False, "write": True}
+    multipart = {"auth": True, "write": True, "multipart": True}
+
+    return [
+        # public site
+        ("health", "GET", "/api/health/", None, public),
+        ("health live", "GET", "/api/health/live/", None, public),
+        ("health ready", "GET", "/api/health/ready/", None, public),
+        ("bootstrap", "GET", "/api/bootstrap/", None, public),
+        ("categories list", "GET", "/api/categories/", None, public),
+        ("category detail", "GET", f"/api/categories/{cat}/", None, public),
+        ("events list", "GET", "/api/events/", None, public),
+        ("event detail", "GET", f"/api/events/{ev}/", None, public),
+        ("gallery list", "GET", "/api/gallery/", None, public),
+        ("gallery carousel", "GET", "/api/gallery/?type=carousel", None, public),
+        ("gallery cursor page", "GET", "/api/gallery/?pagination=cursor", None, public),
+        ("gallery detail", "GET", f"/api/gallery/{g}/", None, public),
+        ("api root", "GET", "/api/", None, public),
+        ("exhibitor register", "POST", "/api/exhibitor-registrations/", fx.exhibitor_body, public_write),
+        ("visitor register", "POST", "/api/visitor-registrations/", fx.visitor_body, public_write),
+
+        # admin dashboard
+        ("exhibitors list", "GET", "/api/exhibitor-registrations/", None, admin),
+        ("exhibitors cursor page", "GET", "/api/exhibitor-registrations/?pagination=cursor", None, admin),
+        ("exhibitors filtered", "GET", "/api/exhibitor-registrations/?status=pending&fields=id,company_name,status", None, admin),
+        ("exhibitor detail", "GET", f"/api/exhibitor-registrations/{e}/", None, admin),
+        ("exhibitor update", "PATCH", f"/api/exhibitor-registrations/{e}/", {"status": "contacted"}, write),
+        ("exhibitors export", "GET", "/api/exhibitor-registrations/export/?output=csv&status=paid", None, admin),
+        ("exhibitors bulk status", "POST", "/api/exhibitor-registrations/bulk-status/", {"status": "contacted", "ids": [e]}, write),
+        ("exhibitors import", "POST", "/api/exhibitor-registrations/import/", fx.import_body(fx.exhibitor_body), multipart),
+        ("visitors list", "GET", "/api/visitor-registrations/", None, admin),
+        ("visitor detail", "GET", f"/api/visitor-registrations/{v}/", None, admin),
+        ("visitors export", "GET", "/api/visitor-registrations/export/?output=ndjson&status=paid", None, admin),
+        ("visitors bulk status", "POST", "/api/visitor-registrations/bulk-status/", {"status": "contacted", "ids": [v]}, write),
+        ("visitors import", "POST", "/api/visitor-registrations/import/", fx.import_body(fx.visitor_body), multipart),
+        ("stats summary", "GET", "/api/stats/", None, admin),
+        ("stats daily", "GET", "/api/stats/exhibitors/?bucket=day", None, admin),
+        ("cache stats", "GET", "/api/cache/stats/", None, admin),
+        ("metrics", "GET", "/api/metrics/", None, public),
+        ("event create", "POST", "/api/events/", {"title": "Bench", "location": "Delhi", "start_date": "2030-01-01", "end_date": "2030-01-03"}, write),
+        ("category create", "POST", "/api/categories/", {"name": "Bench", "description": "Bench", "icon": "BE"}, multipart),
+        ("gallery create", "POST", "/api/gallery/", {"title": "Bench", "description": "Bench", "type": "gallery"}, multipart),
+        ("gallery update", "PATCH", f"/api/gallery/{g}/", {"display_order": 5}, multipart),
+        ("gallery delete", "DELETE", lambda i: f"/api/gallery/{fx.gallery_row(i).pk}/", None, write),
+        ("category upload url", "POST", "/api/categories/upload-url/", {"filename": "a.jpg", "content_type": "image/jpeg", "size": 1000}, write),
+        ("gallery upload url", "POST", "/api/gallery/upload-url/", {"filename": "a.jpg", "content_type": "image/jpeg", "size": 1000}, write),
+
+        # accounts
+        ("login", "POST", "/api/login/", {"username": fx.admin.username, "password": BENCH_PASSWORD}, public_write),
+        ("create admin", "POST", "/api/create-admin/", None, public_write),
+        ("team list", "GET", "/api/team/list/", None, admin),
+        ("team create", "POST", "/api/team/create/", lambda i: {"name": "Bench", "email": fx.email("team", i), "role": "sales"}, write),
+        ("team delete", "DELETE", lambda i: f"/api/team/delete/{fx.team_user(i, 'delete').pk}/", None, write),
+        ("send otp", "POST", "/api/password/send-otp/", fx.send_otp_body, public_write),
+        ("verify otp", "POST", "/api/password/verify-otp/", fx.otp_body, public_write),
+        ("create password", "POST", "/api/password/create/", fx.create_password_body, public_write),
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive every route in api/urls.py and record p50/p95/p99 latency, queries per "
+        "request and peak allocated memory. Save a baseline JSON and compare later runs "
+        "against it. Writes happen in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=30, help="Timed requests per route")
+        parser.add_argument("--warmup", type=int, default=3, help="Untimed requests per route first")
+        parser.add_argument("--only", action="append", help="Run scenarios whose name contains this (repeatable)")
+        parser.add_argument("--save-baseline", metavar="PATH", help="Write the results to this JSON file")
+        parser.add_argument("--compare", metavar="PATH", help="Fail on regressions against this baseline JSON")
+        parser.add_argument("--threshold", type=float, default=0.25, help="Allowed p95 slowdown vs the baseline (0.25 = 25%%)")
+        parser.add_argument("--min-delta-ms", type=float, default=2.0, help="Ignore p95 slowdowns smaller than this")
+        parser.add_argument("--base-url", help="Benchmark a running server (e.g. http://127.0.0.1:8000) instead of the test client; GET routes only")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1:
+            raise CommandError("--requests must be at least 1")
+
+        if options["base_url"]:
+            results = self._run_live(options)
+        else:
+            try:
+                # the test client talks to "testserver"
+                with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+                    with transaction.atomic():
+                        results = self._run_in_process(options)
+                        transaction.set_rollback(True)
+            finally:
+                # responses cached during the run may include rolled back rows
+                for model in (Category, Event, ExhibitorRegistration, VisitorRegistration, GalleryImage):
+                    bump_version(model_namespace(model))
+
+        self._report(results)
+
+        if options["save_baseline"]:
+            self._save(options["save_baseline"], results, options)
+        if options["compare"]:
+            self._compare(options["compare"], results, options)
+
+    # ------------------------------
+    # runners
+    # ------------------------------
+    def _selected(self, fixtures, options):
+        chosen = scenarios(fixtures)
+        if options["only"]:
+            chosen = [s for s in chosen if any(term in s[0] for term in options["only"])]
+        return chosen
+
+    def _run_in_process(self, options):
+        admin = User.objects.create_superuser(
+            username=f"bench_admin_{uuid.uuid4().hex[:8]}",
+            email="bench-admin@example.com",
+            password=BENCH_PASSWORD,
+            role="admin",
+        )
+        fixtures = Fixtures(admin)
+        access = create_tokens_for_user(admin)["access"]
+        chosen = self._selected(fixtures, options)
+
+        if not options["only"]:
+            covered = {route_key(_resolve(path, 0)) for _, _, path, _, _ in chosen}
+            missing = route_keys() - covered - S3_ROUTES
+            if missing:
+                raise CommandError(f"Routes without a benchmark scenario: {', '.join(sorted(missing))}")
+            self.stdout.write(f"skipped (need a real S3 bucket): {', '.join(sorted(S3_ROUTES))}")
+
+        client = Client()
+        results = {}
+        counter = iter(range(10 ** 9))
+
+        for name, method, path, body, opts in chosen:
+            headers = {"HTTP_AUTHORIZATION": f"Bearer {access}"} if opts["auth"] else {}
+
+            def prepare():
+                # per-iteration set-up runs outside the timer and query capture
+                i = next(counter)
+                return _resolve(path, i), _resolve(body, i)
+
+            def call(prepared):
+                return self._request(client, method, *prepared, opts, headers)
+
+            for _ in range(options["warmup"]):
+                call(prepare())
+
+            gc.collect()
+            latencies, queries, statuses = [], [], set()
+            for _ in range(options["requests"]):
+                prepared = prepare()
+                with CaptureQueriesContext(connection) as captured:
+                    elapsed, status = call(prepared)
+                latencies.append(elapsed)
+                queries.append(len(captured))
+                statuses.add(status)
+
+            prepared = prepare()
+            tracemalloc.start()
+            try:
+                call(prepared)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            results[name] = self._summary(latencies, statuses, opts, queries=max(queries), peak_kb=round(peak / 1024, 1))
+        return results
+
+    def _request(self, client, method, path, body, opts, headers):
+        """One request; returns (elapsed ms, status)."""
+        kwargs = dict(headers)
+        if body is not None:
+            if opts.get("multipart"):
+                kwargs["data"] = body
+            else:
+                kwargs["data"] = json.dumps(body)
+                kwargs["content_type"] = "application/json"
+        elif opts.get("multipart") and method in ("POST", "PATCH"):
+            kwargs["data"] = {}
+
+        if opts.get("multipart") and method == "PATCH":
+            # the test client only multipart-encodes POST bodies
+            kwargs["data"] = client._encode_data(kwargs["data"], "multipart/form-data; boundary=BoUnDaRyStRiNg")
+            kwargs["content_type"] = "multipart/form-data; boundary=BoUnDaRyStRiNg"
+
+        started = time.perf_counter()
+        response = getattr(client, method.lower())(path, **kwargs)
+        if response.streaming:
+            b"".join(response.streaming_content)
+        elapsed = (time.perf_counter() - started) * 1000
+        return elapsed, response.status_code
+
+    def _run_live(self, options):
+        base_url = options["base_url"].rstrip("/")
+        admin = User.objects.create_superuser(
+            username=f"bench_admin_{uuid.uuid4().hex[:8]}",
+            email="bench-admin@example.com",
+            password=BENCH_PASSWORD,
+            role="admin",
+        )
+        try:
+            fixtures = Fixtures(admin)
+            access = create_tokens_for_user(admin)["access"]
+            results = {}
+            for name, method, path, body, opts in self._selected(fixtures, options):
+                if method != "GET":
+                    continue
+                headers = {"Authorization": f"Bearer {access}"} if opts["auth"] else {}
+                url = base_url + _resolve(path, 0)
+
+                for _ in range(options["warmup"]):
+                    _fetch(url, headers)
+
+                latencies, statuses = [], set()
+                for _ in range(options["requests"]):
+                    started = time.perf_counter()
+                    statuses.add(_fetch(url, headers))
+                    latencies.append((time.perf_counter() - started) * 1000)
+
+                results[name] = self._summary(latencies, statuses, opts, queries=None, peak_kb=None)
+            return results
+        finally:
+            admin.delete()
+
+    def _summary(self, latencies, statuses, opts, queries, peak_kb):
+        ordered = sorted(latencies)
+        expected = opts.get("expect")
+        ok = all(status in expected for status in statuses) if expected else all(status < 500 for status in statuses)
+        return {
+            "p50": round(percentile(ordered, 0.50), 2),
+            "p95": round(percentile(ordered, 0.95), 2),
+            "p99": round(percentile(ordered, 0.99), 2),
+            "queries": queries,
+            "peak_kb": peak_kb,
+            "statuses": sorted(statuses),
+            "ok": ok,
+        }
+
+    # ------------------------------
+    # output / baseline
+    # ------------------------------
+    def _report(self, results):
+        self.stdout.write(f"{'route':<26} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'peak KB':>9}  status")
+        for name, r in results.items():
+            line = (
+                f"{name:<26} {r['p50']:>8.2f} {r['p95']:>8.2f} {r['p99']:>8.2f} "
+                f"{'-' if r['queries'] is None else r['queries']:>8} "
+                f"{'-' if r['peak_kb'] is None else r['peak_kb']:>9}  {','.join(map(str, r['statuses']))}"
+            )
+            self.stdout.write(line if r["ok"] else self.style.ERROR(line))
+
+        failed = [name for name, r in results.items() if not r["ok"]]
+        if failed:
+            raise CommandError(f"Unexpected status codes: {', '.join(failed)}")
+
+    def _save(self, path, results, options):
+        payload = {
+            "created_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "database": connection.vendor,
+            "cache": settings.CACHES["default"]["BACKEND"],
+            "requests": options["requests"],
+            "results": results,
+        }
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+        self.stdout.write(self.style.SUCCESS(f"Baseline written to {path}"))
+
+    def _compare(self, path, results, options):
+        try:
+            with open(path, encoding="utf-8") as handle:
+                baseline = json.load(handle)["results"]
+        except (OSError, ValueError, KeyError) as exc:
+            raise CommandError(f"Cannot read baseline {path}: {exc}")
+
+        regressions = []
+        for name, current in results.items():
+            before = baseline.get(name)
+            if not before:
+                continue
+
+            delta = current["p95"] - before["p95"]
+            if delta > options["min_delta_ms"] and current["p95"] > before["p95"] * (1 + options["threshold"]):
+                regressions.append(f"{name}: p95 {before['p95']:.2f} -> {current['p95']:.2f} ms")
+            if None not in (current["queries"], before["queries"]) and current["queries"] > before["queries"]:
+                regressions.append(f"{name}: queries {before['queries']} -> {current['queries']}")
+
+        if regressions:
+            raise CommandError("Regressions against baseline:\n  " + "\n  ".join(regressions))
+        self.stdout.write(self.style.SUCCESS(f"No regressions against {path}"))
+
+
+def _resolve(value, i):
+    return value(i) if callable(value) else value
+
+
+def _fetch(url, headers):
+    try:
+        with urlopen(Request(url, headers=headers), timeout=30) as response:
+            response.read()
+            return response.status
+    except HTTPError as exc:
+        return exc.code
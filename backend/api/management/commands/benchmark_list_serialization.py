@@ -0,0 +1,122 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from api.fastrows import compile_row_plan
+from api.models import ExhibitorRegistration, GalleryImage, VisitorRegistration
+from api.serializers import (
+    ExhibitorRegistrationSerializer,
+    GalleryImageSerializer,
+    VisitorRegistrationSerializer,
+)
+
+
+def _exhibitor(index):
+    return ExhibitorRegistration(
+        company_name=f"Company {index}",
+        contact_person_name=f"Contact {index}",
+        designation="Manager",
+        email_address=f"exhibitor{index}@example.com",
+        contact_number="9876543210",
+        product_category=f"Category {index % 16}",
+        company_address=f"{index} Industrial Estate, Sector {index % 40}, New Delhi",
+        status=("pending", "contacted", "paid")[index % 3],
+    )
+
+
+def _visitor(index):
+    return VisitorRegistration(
+        first_name=f"First {index}",
+        last_name=f"Last {index}",
+        company_name=f"Company {index}",
+        email_address=f"visitor{index}@example.com",
+        phone_number="9876543210",
+        industry_interest=f"Industry {index % 16}",
+    )
+
+
+def _gallery(index):
+    return GalleryImage(
+        title=f"Photo {index}",
+        description="Show floor",
+        image=f"https://cdn.example.com/gallery/{index}.jpg",
+        image_variants={"320w": f"https://cdn.example.com/gallery/{index}_w320.webp"},
+        type=("carousel", "banner", "gallery")[index % 3],
+        display_order=index % 50,
+    )
+
+
+# kind -> (model, serializer, row factory, list ordering)
+TARGETS = {
+    "exhibitors": (ExhibitorRegistration, ExhibitorRegistrationSerializer, _exhibitor, ("-created_at", "-id")),
+    "visitors": (VisitorRegistration, VisitorRegistrationSerializer, _visitor, ("-created_at", "-id")),
+    "gallery": (GalleryImage, GalleryImageSerializer, _gallery, ("display_order", "-created_at", "-id")),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Rows per second of the serializer list path vs the .values() fast path "
+        "(api.fastrows), checking both render byte-identical JSON. "
+        "Benchmark rows are inserted in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--kind", choices=sorted(TARGETS), action="append", help="Repeatable (default: all)")
+        parser.add_argument("--rows", default="1000,10000,100000", help="Comma separated row counts")
+        parser.add_argument("--repeat", type=int, default=3, help="Best of N timings per path")
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted({int(size) for size in options["rows"].split(",") if size.strip()})
+        except ValueError:
+            raise CommandError("--rows must be comma separated integers")
+
+        for kind in options["kind"] or sorted(TARGETS):
+            with transaction.atomic():
+                self._run(kind, sizes, options["repeat"])
+                transaction.set_rollback(True)
+
+    def _run(self, kind, sizes, repeat):
+        model, serializer_class, factory, ordering = TARGETS[kind]
+        existing = model.objects.count()
+        missing = max(sizes) - existing
+        if missing > 0:
+            model.objects.bulk_create((factory(existing + index) for index in range(missing)), batch_size=2000)
+
+        plan = compile_row_plan(serializer_class())
+        if plan is None:
+            raise CommandError(f"{serializer_class.__name__} is not supported by the fast path")
+
+        renderer = JSONRenderer()
+        self.stdout.write(f"{kind}:")
+
+        for size in sizes:
+            queryset = model.objects.order_by(*ordering)[:size]
+
+            def serializer_path():
+                return renderer.render(serializer_class(list(queryset), many=True).data)
+
+            def fast_path():
+                return renderer.render(plan.render(queryset.values(*plan.columns)))
+
+            slow_body, slow_seconds = self._best_of(serializer_path, repeat)
+            fast_body, fast_seconds = self._best_of(fast_path, repeat)
+            if slow_body != fast_body:
+                raise CommandError(f"{kind} x {size}: fast path output differs from the serializer")
+
+            self.stdout.write(
+                f"  {size:>7} rows   serializer {size / slow_seconds:>10,.0f} rows/s   "
+                f"fast {size / fast_seconds:>10,.0f} rows/s   {slow_seconds / fast_seconds:4.1f}x   identical"
+            )
+
+    def _best_of(self, run, repeat):
+        best = None
+        for _ in range(max(1, repeat)):
+            started = time.perf_counter()
+            body = run()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return body, best
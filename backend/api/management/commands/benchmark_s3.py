@@ -0,0 +1,124 @@
+import contextlib
+import os
+import statistics
+import time
+
+import boto3
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from api import utils
+
+BENCHMARK_FOLDER = "benchmark"
+
+
+def _legacy_upload(file_obj, folder):
+    """The pre-pooling upload path: a brand new client for every call."""
+    s3 = boto3.client(
+        "s3",
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_S3_REGION_NAME,
+        endpoint_url=settings.AWS_S3_ENDPOINT_URL or None,
+    )
+    key = f"{folder}/legacy-{time.perf_counter_ns()}.bin"
+    s3.upload_fileobj(
+        Fileobj=file_obj,
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=key,
+        ExtraArgs={"ContentType": file_obj.content_type},
+    )
+
+
+def _summary(samples):
+    ordered = sorted(samples)
+    return {
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-upload latency of a new boto3 client per call (old behaviour) "
+        "against the shared pooled client, using a local S3 stand-in."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--uploads", type=int, default=30)
+        parser.add_argument("--size", type=int, default=256 * 1024, help="Bytes per uploaded object")
+        parser.add_argument("--endpoint-url", default=None, help="Local S3 stand-in, e.g. http://localhost:5000 (moto_server / MinIO)")
+        parser.add_argument("--bucket", default=None, help="Bucket to upload into (default: AWS_STORAGE_BUCKET_NAME)")
+        parser.add_argument("--moto", action="store_true", help="Run against moto's in-process S3 mock (requires `pip install moto`)")
+
+    def handle(self, *args, **options):
+        if not (options["moto"] or options["endpoint_url"]):
+            raise CommandError("Refusing to benchmark against real S3: pass --moto or --endpoint-url")
+
+        overrides = {}
+        if options["endpoint_url"]:
+            overrides["AWS_S3_ENDPOINT_URL"] = options["endpoint_url"]
+        if options["bucket"]:
+            overrides["AWS_STORAGE_BUCKET_NAME"] = options["bucket"]
+
+        with contextlib.ExitStack() as stack:
+            if options["moto"]:
+                try:
+                    from moto import mock_aws
+                except ImportError:
+                    raise CommandError("moto is not installed (pip install moto)")
+                stack.enter_context(mock_aws())
+                overrides["AWS_S3_ENDPOINT_URL"] = ""
+
+            stack.enter_context(override_settings(**overrides))
+            self._run(options["uploads"], options["size"])
+
+    def _run(self, uploads, size):
+        # start from a cold shared client so its one-off build cost is counted
+        utils._s3_client = None
+
+        client = utils.get_s3_client()
+        bucket = settings.AWS_STORAGE_BUCKET_NAME
+        try:
+            client.head_bucket(Bucket=bucket)
+        except client.exceptions.ClientError:
+            location = {}
+            # us-east-1 is the default location and rejects an explicit constraint
+            if settings.AWS_S3_REGION_NAME != "us-east-1":
+                location["CreateBucketConfiguration"] = {"LocationConstraint": settings.AWS_S3_REGION_NAME}
+            client.create_bucket(Bucket=bucket, **location)
+        utils._s3_client = None
+
+        payload = os.urandom(size)
+        results = {}
+
+        for label, upload in (("new client per upload", _legacy_upload), ("shared pooled client", utils.upload_to_s3)):
+            samples = []
+            for index in range(uploads):
+                file_obj = SimpleUploadedFile(f"bench-{index}.bin", payload, content_type="application/octet-stream")
+                started = time.perf_counter()
+                upload(file_obj, folder=BENCHMARK_FOLDER)
+                samples.append((time.perf_counter() - started) * 1000)
+            results[label] = _summary(samples)
+
+        self._cleanup(bucket)
+
+        self.stdout.write(f"{uploads} uploads of {size} bytes each")
+        for label, summary in results.items():
+            self.stdout.write(
+                f"{label:<24} mean {summary['mean']:8.2f} ms   p50 {summary['p50']:8.2f} ms   p95 {summary['p95']:8.2f} ms"
+            )
+
+        before, after = (summary["mean"] for summary in results.values())
+        self.stdout.write(self.style.SUCCESS(f"speedup: {before / after:.1f}x per upload"))
+
+    def _cleanup(self, bucket):
+        client = utils.get_s3_client()
+        paginator = client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=f"{BENCHMARK_FOLDER}/"):
+            keys = [{"Key": item["Key"]} for item in page.get("Contents", [])]
+            if keys:
+                client.delete_objects(Bucket=bucket, Delete={"Objects": keys, "Quiet": True})
@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from api.models import (
+    ExhibitorRegistration,
+    VisitorRegistration,
+    Category,
+    Event,
+    GalleryImage,
+    PasswordSetupToken,
+)
+
+
+def main_queries():
+    """
+    (label, queryset, acceptable index names) for the hot read paths.
+    """
+    day_ago = timezone.now() - timedelta(days=1)
+
+    return [
+        ("exhibitor list", ExhibitorRegistration.objects.order_by("-created_at", "-id")[:10],
+         ["exhibitor_created_idx"]),
+        ("exhibitor by status", ExhibitorRegistration.objects.filter(status="paid").order_by("-created_at")[:10],
+         ["exhibitor_status_created_idx"]),
+        ("exhibitor pending queue", ExhibitorRegistration.objects.filter(status="pending").order_by("-created_at", "-id")[:10],
+         ["exhibitor_pending_idx"]),
+        ("exhibitor status counts", ExhibitorRegistration.objects.values("status").annotate(total=Count("id")).order_by(),
+         ["exhibitor_status_created_idx"]),
+        ("visitor list", VisitorRegistration.objects.order_by("-created_at", "-id")[:10],
+         ["visitor_created_idx"]),
+        ("visitor by status", VisitorRegistration.objects.filter(status="paid").order_by("-created_at")[:10],
+         ["visitor_status_created_idx"]),
+        ("visitor pending queue", VisitorRegistration.objects.filter(status="pending").order_by("-created_at", "-id")[:10],
+         ["visitor_pending_idx"]),
+        ("visitor status counts", VisitorRegistration.objects.values("status").annotate(total=Count("id")).order_by(),
+         ["visitor_status_created_idx"]),
+        ("category list", Category.objects.order_by("-created_at")[:10],
+         ["category_created_idx"]),
+        ("active events", Event.objects.filter(is_active=True).order_by("start_date")[:10],
+         ["event_active_start_idx", "event_start_idx"]),
+        ("event list", Event.objects.order_by("-start_date")[:10],
+         ["event_start_idx"]),
+        ("gallery list", GalleryImage.objects.order_by("display_order", "-created_at", "-id")[:10],
+         ["gallery_order_idx"]),
+        ("gallery by type", GalleryImage.objects.filter(type="carousel").order_by("display_order", "-created_at", "-id")[:10],
+         ["gallery_type_order_idx"]),
+        ("expired tokens", PasswordSetupToken.objects.filter(created_at__lt=day_ago),
+         ["token_created_idx"]),
+    ]
+
+
+# Partial indexes (WHERE status = 'pending'). SQLite cannot use them when
+# the status arrives as a bound parameter, which is how Django sends it,
+# so these are only checked on PostgreSQL.
+PARTIAL_INDEX_QUERIES = {"exhibitor pending queue", "visitor pending queue"}
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the main list/filter queries and fail if any of them does not use its index."
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ("postgresql", "sqlite"):
+            raise CommandError(f"Unsupported database vendor: {connection.vendor}")
+
+        failures = []
+
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                # Empty or tiny tables make a seq scan cheapest; we only want
+                # to know the planner *can* serve each query from an index.
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for label, queryset, index_names in main_queries():
+                if label in PARTIAL_INDEX_QUERIES and connection.vendor == "sqlite":
+                    self.stdout.write(self.style.WARNING(f"skip  {label}: partial index, checked on PostgreSQL only"))
+                    continue
+
+                plan = queryset.explain()
+                used = [name for name in index_names if name in plan]
+
+                if options["verbosity"] >= 2:
+                    self.stdout.write(f"--- {label}\n{plan}")
+
+                if used:
+                    self.stdout.write(f"ok    {label}: {used[0]}")
+                else:
+                    failures.append(label)
+                    self.stdout.write(self.style.ERROR(f"FAIL  {label}: expected one of {index_names}"))
+
+        if failures:
+            raise CommandError(f"{len(failures)} queries do not use an index: {', '.join(failures)}")
+
+        self.stdout.write(self.style.SUCCESS("All main queries use an index."))
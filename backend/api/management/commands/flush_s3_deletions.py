@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from api.s3_deletions import flush_s3_deletions
+
+
+class Command(BaseCommand):
+    help = "Delete queued S3 objects with DeleteObjects (up to 1000 keys per call), retrying failures."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--loop", action="store_true", help="Keep polling instead of exiting once nothing is due")
+        parser.add_argument("--interval", type=float, default=60.0, help="Seconds to sleep when nothing is due (with --loop)")
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            counts = flush_s3_deletions(options["batch_size"])
+
+            if any(counts.values()):
+                self.stdout.write(f"deleted {counts['deleted']}, retrying {counts['retrying']}")
+                if counts["deleted"]:
+                    # a full batch may mean more is due right now
+                    continue
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,31 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework import serializers
+
+from api.importers import IMPORT_KINDS, import_registrations_csv
+
+
+class Command(BaseCommand):
+    help = "Bulk import exhibitor or visitor registrations from a CSV file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(IMPORT_KINDS))
+        parser.add_argument("path", help="CSV file with a header row named after the model fields")
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"], "rb") as fh:
+                report = import_registrations_csv(options["kind"], fh, options["batch_size"])
+        except OSError as exc:
+            raise CommandError(str(exc))
+        except serializers.ValidationError as exc:
+            raise CommandError(json.dumps(exc.detail))
+
+        for error in report["errors"]:
+            self.stderr.write(f"line {error['line']}: {json.dumps(error['errors'])}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['created']} {options['kind']}, rejected {report['rejected']}"
+        ))
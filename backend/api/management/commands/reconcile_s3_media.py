@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.models import Category, GalleryImage, PendingS3Deletion
+from api.s3_deletions import DELETE_OBJECTS_MAX_KEYS, delete_keys
+from api.utils import get_s3_client, key_from_url
+
+MEDIA_PREFIXES = ("categories/", "gallery/")
+
+# models whose rows reference media through `image` / `image_variants`
+MEDIA_MODELS = (Category, GalleryImage)
+
+
+def referenced_keys():
+    """Every object key referenced by a row, originals and variants."""
+    keys = set()
+    for model in MEDIA_MODELS:
+        rows = model.objects.exclude(image__isnull=True).values_list("image", "image_variants")
+        for image, variants in rows.iterator(chunk_size=2000):
+            for file_url in [image, *(variants or {}).values()]:
+                key = key_from_url(file_url)
+                if key:
+                    keys.add(key)
+    return keys
+
+
+class Command(BaseCommand):
+    help = (
+        "Find objects under the media prefixes that no Category / GalleryImage row "
+        "references, and report them (default) or delete them in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--prefix", action="append", dest="prefixes", help="Prefix to scan (repeatable, default: categories/ and gallery/)")
+        parser.add_argument("--delete", action="store_true", help="Delete orphans instead of only reporting them")
+        parser.add_argument("--grace-hours", type=float, default=24.0, help="Ignore objects newer than this (in-flight uploads)")
+        parser.add_argument("--batch-size", type=int, default=DELETE_OBJECTS_MAX_KEYS)
+        parser.add_argument("--quiet", action="store_true", help="Only print the summary")
+
+    def handle(self, *args, **options):
+        prefixes = options["prefixes"] or MEDIA_PREFIXES
+        batch_size = max(1, min(options["batch_size"], DELETE_OBJECTS_MAX_KEYS))
+        cutoff = timezone.now() - timedelta(hours=options["grace_hours"])
+
+        # keys already queued are handled by flush_s3_deletions
+        referenced = referenced_keys() | set(PendingS3Deletion.objects.values_list("key", flat=True))
+        counts = {"scanned": 0, "referenced": 0, "recent": 0, "orphaned": 0, "deleted": 0, "failed": 0}
+
+        client = get_s3_client()
+        paginator = client.get_paginator("list_objects_v2")
+        orphans = []
+
+        for prefix in prefixes:
+            pages = paginator.paginate(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                Prefix=prefix,
+                PaginationConfig={"PageSize": 1000},
+            )
+            for page in pages:
+                for item in page.get("Contents", []):
+                    counts["scanned"] += 1
+                    key = item["Key"]
+
+                    if key in referenced:
+                        # each key is listed once; what is left at the end is missing
+                        referenced.discard(key)
+                        counts["referenced"] += 1
+                    elif item["LastModified"] > cutoff:
+                        counts["recent"] += 1
+                    else:
+                        orphans.append(key)
+                        if len(orphans) >= batch_size:
+                            self._handle_orphans(orphans, counts, options)
+                            orphans = []
+
+        if orphans:
+            self._handle_orphans(orphans, counts, options)
+
+        missing = sorted(key for key in referenced if key.startswith(tuple(prefixes)))
+        if missing and not options["quiet"]:
+            for key in missing[:20]:
+                self.stdout.write(self.style.WARNING(f"missing: {key}"))
+
+        self.stdout.write(
+            f"scanned {counts['scanned']}, referenced {counts['referenced']}, "
+            f"too recent {counts['recent']}, orphaned {counts['orphaned']}, "
+            f"deleted {counts['deleted']}, failed {counts['failed']}, "
+            f"referenced but missing {len(missing)}"
+        )
+
+    def _handle_orphans(self, keys, counts, options):
+        counts["orphaned"] += len(keys)
+
+        if not options["delete"]:
+            if not options["quiet"]:
+                for key in keys:
+                    self.stdout.write(f"orphan: {key}")
+            return
+
+        failed = delete_keys(keys)
+        counts["deleted"] += len(keys) - len(failed)
+        counts["failed"] += len(failed)
+        for key, error in failed.items():
+            self.stderr.write(f"could not delete {key}: {error}")
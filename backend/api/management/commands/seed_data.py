@@ -0,0 +1,184 @@
+import random
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from api.caching import bump_version, model_namespace
+from api.models import Category, Event, ExhibitorRegistration, GalleryImage, VisitorRegistration
+
+SEED_DOMAIN = "seed.example.com"
+SEED_CDN = "https://cdn.example.com/seed"
+
+INDUSTRIES = (
+    "Textiles", "Machinery", "Food Processing", "Packaging", "Electronics", "Automotive",
+    "Pharmaceuticals", "Chemicals", "Handicrafts", "Furniture", "Leather", "Plastics",
+    "Renewable Energy", "Construction", "Agriculture", "Logistics",
+)
+
+# funnel shape of a real show: most leads never move past "pending"
+STATUS_WEIGHTS = {"pending": 60, "contacted": 25, "paid": 10, "rejected": 5}
+
+GALLERY_TYPE_WEIGHTS = {"gallery": 70, "exhibitor": 15, "carousel": 10, "banner": 5}
+
+FIRST_NAMES = ("Aarav", "Priya", "Rahul", "Ananya", "Vikram", "Sneha", "Arjun", "Kavya", "Rohan", "Isha")
+LAST_NAMES = ("Sharma", "Patel", "Singh", "Gupta", "Kumar", "Reddy", "Iyer", "Mehta", "Das", "Nair")
+COMPANY_SUFFIXES = ("Industries", "Exports", "Traders", "Pvt Ltd", "Enterprises", "Manufacturing")
+CITIES = ("New Delhi", "Mumbai", "Bengaluru", "Chennai", "Ahmedabad", "Kolkata", "Pune", "Jaipur")
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate synthetic exhibitors, visitors, events, categories and gallery rows "
+        "with realistic distributions (for benchmarks and local development)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--exhibitors", type=int, default=5000)
+        parser.add_argument("--visitors", type=int, default=20000)
+        parser.add_argument("--events", type=int, default=5)
+        parser.add_argument("--categories", type=int, default=len(INDUSTRIES))
+        parser.add_argument("--gallery", type=int, default=300)
+        parser.add_argument("--days", type=int, default=120, help="Spread registrations over this many past days")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed, so runs are reproducible")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--clear", action="store_true", help="Delete previously seeded rows first")
+
+    def handle(self, *args, **options):
+        if options["categories"] > len(INDUSTRIES):
+            raise CommandError(f"At most {len(INDUSTRIES)} categories")
+
+        self.rng = random.Random(options["seed"])
+        self.now = timezone.now()
+        self.batch_size = options["batch_size"]
+
+        with transaction.atomic():
+            if options["clear"]:
+                self._clear()
+
+            industries = self._categories(options["categories"])
+            self._events(options["events"])
+            self._registrations(ExhibitorRegistration, options["exhibitors"], options["days"], self._exhibitor, industries)
+            self._registrations(VisitorRegistration, options["visitors"], options["days"], self._visitor, industries)
+            self._gallery(options["gallery"])
+
+        # seeded rows bypass the viewsets, so drop cached responses / stats
+        for model in (Category, Event, ExhibitorRegistration, VisitorRegistration, GalleryImage):
+            bump_version(model_namespace(model))
+
+        self.stdout.write(self.style.SUCCESS("Seed data created."))
+
+    # ------------------------------
+    # distributions
+    # ------------------------------
+    def _weighted(self, weights):
+        return self.rng.choices(list(weights), weights=list(weights.values()))[0]
+
+    def _industry(self, industries):
+        # Zipf-like: a few categories draw most of the interest
+        return self.rng.choices(industries, weights=[1 / (rank + 1) for rank in range(len(industries))])[0]
+
+    def _created_at(self, days):
+        # newer registrations are more common as the show approaches
+        age = days * (1 - self.rng.random() ** 0.5)
+        return self.now - timedelta(days=age, seconds=self.rng.randrange(86400))
+
+    def _phone(self):
+        return f"9{self.rng.randrange(10 ** 9):09d}"
+
+    def _company(self):
+        return f"{self.rng.choice(LAST_NAMES)} {self.rng.choice(COMPANY_SUFFIXES)}"
+
+    # ------------------------------
+    # rows
+    # ------------------------------
+    def _clear(self):
+        ExhibitorRegistration.objects.filter(email_address__endswith=f"@{SEED_DOMAIN}").delete()
+        VisitorRegistration.objects.filter(email_address__endswith=f"@{SEED_DOMAIN}").delete()
+        GalleryImage.objects.filter(image__startswith=SEED_CDN).delete()
+        Category.objects.filter(image__startswith=SEED_CDN).delete()
+        Event.objects.filter(description__startswith="[seed]").delete()
+
+    def _categories(self, count):
+        industries = list(INDUSTRIES[:count])
+        Category.objects.bulk_create([
+            Category(
+                name=name,
+                description=f"{name} products and suppliers",
+                icon=name[:2].upper(),
+                image=f"{SEED_CDN}/categories/{index}.jpg",
+            )
+            for index, name in enumerate(industries)
+        ])
+        self.stdout.write(f"categories: {len(industries)}")
+        return industries
+
+    def _events(self, count):
+        events = []
+        for index in range(count):
+            # one upcoming active show, the rest are past editions
+            start = (self.now + timedelta(days=60 - 365 * index)).date()
+            events.append(Event(
+                title=f"Trade Fair {start.year}",
+                location=self.rng.choice(CITIES),
+                venue="Exhibition Grounds",
+                start_date=start,
+                end_date=start + timedelta(days=3),
+                is_active=index == 0,
+                description=f"[seed] Edition {count - index}",
+            ))
+        Event.objects.bulk_create(events)
+        self.stdout.write(f"events: {count}")
+
+    def _exhibitor(self, index, industries):
+        first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+        return ExhibitorRegistration(
+            company_name=self._company(),
+            contact_person_name=f"{first} {last}",
+            designation=self.rng.choice(("Director", "Sales Manager", "Owner", "Marketing Head")),
+            email_address=f"exhibitor{index}@{SEED_DOMAIN}",
+            contact_number=self._phone(),
+            product_category=self._industry(industries),
+            company_address=f"{self.rng.randrange(1, 500)}, Industrial Area, {self.rng.choice(CITIES)}",
+            status=self._weighted(STATUS_WEIGHTS),
+        )
+
+    def _visitor(self, index, industries):
+        return VisitorRegistration(
+            first_name=self.rng.choice(FIRST_NAMES),
+            last_name=self.rng.choice(LAST_NAMES),
+            company_name=self._company(),
+            email_address=f"visitor{index}@{SEED_DOMAIN}",
+            phone_number=self._phone(),
+            industry_interest=self._industry(industries),
+            status=self._weighted(STATUS_WEIGHTS),
+        )
+
+    def _registrations(self, model, count, days, factory, industries):
+        offset = model.objects.filter(email_address__endswith=f"@{SEED_DOMAIN}").count()
+        for start in range(0, count, self.batch_size):
+            rows = model.objects.bulk_create([
+                factory(offset + index, industries)
+                for index in range(start, min(start + self.batch_size, count))
+            ])
+            # auto_now_add ignores values passed to bulk_create; backdate afterwards
+            for row in rows:
+                row.created_at = self._created_at(days)
+            model.objects.bulk_update(rows, ["created_at"])
+        self.stdout.write(f"{model._meta.verbose_name_plural}: {count}")
+
+    def _gallery(self, count):
+        images = []
+        for index in range(count):
+            url = f"{SEED_CDN}/gallery/{index}.jpg"
+            images.append(GalleryImage(
+                title=f"Show floor {index}",
+                description="Photo from the show floor",
+                image=url,
+                image_variants={f"{width}w": url.replace(".jpg", f"_w{width}.webp") for width in (320, 640, 1280)},
+                type=self._weighted(GALLERY_TYPE_WEIGHTS),
+                display_order=self.rng.randrange(1, 100),
+            ))
+        GalleryImage.objects.bulk_create(images, batch_size=self.batch_size)
+        self.stdout.write(f"gallery images: {count}")
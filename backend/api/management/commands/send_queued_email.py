@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from api.mail import send_queued_emails
+
+
+class Command(BaseCommand):
+    help = "Send due messages from the outbound email queue in batches over one SMTP connection."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--loop", action="store_true", help="Keep polling instead of exiting once the queue is drained")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds to sleep when nothing is due (with --loop)")
+        parser.add_argument(
+            "--backend",
+            default=None,
+            help="Email backend to send through instead of EMAIL_BACKEND, e.g. "
+            "django.core.mail.backends.console.EmailBackend",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            counts = send_queued_emails(options["batch_size"], options["backend"])
+
+            if any(counts.values()):
+                self.stdout.write(
+                    f"sent {counts['sent']}, retrying {counts['retrying']}, failed {counts['failed']}"
+                )
+                # a full batch may mean more is due right now
+                continue
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from api.bootstrap import site_bootstrap
+from api.views import CategoryViewSet, EventViewSet, GalleryImageViewSet
+
+# (viewset, list path) pairs the public site requests on every page load
+WARM_TARGETS = (
+    (CategoryViewSet, "/api/categories/"),
+    (EventViewSet, "/api/events/"),
+    (GalleryImageViewSet, "/api/gallery/"),
+)
+
+
+def default_host():
+    hosts = [host.lstrip(".") for host in settings.ALLOWED_HOSTS if host not in ("*", "")]
+    return hosts[0] if hosts else "localhost"
+
+
+class Command(BaseCommand):
+    help = "Pre-populate the public list response cache and the bootstrap blob (run at deploy time)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default=None, help="Host the site is served under (default: first ALLOWED_HOSTS entry)")
+        parser.add_argument("--secure", action="store_true", help="Build https:// URLs (match what the app sees behind the proxy)")
+        parser.add_argument("--pages", type=int, default=1, help="Number of list pages to warm per endpoint")
+
+    def handle(self, *args, **options):
+        factory = RequestFactory()
+        host = options["host"] or default_host()
+
+        for viewset, path in WARM_TARGETS:
+            view = viewset.as_view({"get": "list"})
+
+            for page in range(1, options["pages"] + 1):
+                query = {"page": page} if page > 1 else {}
+                request = factory.get(path, query, HTTP_HOST=host, secure=options["secure"])
+                response = view(request)
+
+                if response.status_code == 404 and page > 1:
+                    break
+                if response.status_code != 200:
+                    raise CommandError(f"{path} page {page} returned {response.status_code}")
+
+                self.stdout.write(f"{path} page {page}: {response.get('X-Cache', '-')}")
+
+                if not response.data.get("next"):
+                    break
+
+        _, _, hit = site_bootstrap()
+        self.stdout.write(f"/api/bootstrap/: {'HIT' if hit else 'MISS'}")
+
+        self.stdout.write(self.style.SUCCESS("Response cache warmed."))
@@ -0,0 +1,107 @@
+import os
+import time
+
+from django.db import connection
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+# ======================================================
+# PROMETHEUS METRICS (scraped from /api/metrics/)
+# ======================================================
+# With PROMETHEUS_MULTIPROC_DIR set (see gunicorn.conf.py) every process
+# writes its samples there and the endpoint merges them, so a scrape that
+# hits any gunicorn worker sees the totals of all of them, and of the email
+# worker when it shares the directory (see Procfile).
+if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+    # samples are written there from the first metric on
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route, method and status code",
+    ["route", "method", "status"],
+)
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time to produce the response (first byte for streamed exports)",
+    ["route", "method"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database queries per request",
+    ["route", "method"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+S3_SECONDS = Histogram(
+    "s3_operation_duration_seconds",
+    "S3 calls by operation",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+EMAILS = Counter(
+    "emails_total",
+    "Outbox messages: queued in requests, then sent / retrying / failed by the worker",
+    ["outcome"],
+)
+OTP_ISSUED = Counter("otp_issued_total", "OTP codes issued")
+OTP_VERIFICATIONS = Counter("otp_verifications_total", "OTP checks by result", ["result"])
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "Response cache lookups by namespace; hit ratio = hit / (hit + miss)",
+    ["namespace", "result"],
+)
+
+
+def record_emails(counts):
+    """Count a send_queued_emails() result."""
+    for outcome, count in counts.items():
+        if count:
+            EMAILS.labels(outcome).inc(count)
+
+
+def render_metrics():
+    """(body, content type) in the Prometheus text format, merged across processes when possible."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def route_label(request):
+    """URL name (or view path) of the matched route; never the raw path, which is unbounded."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    return match.view_name or match.route
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class PrometheusMetricsMiddleware:
+    """Request count, latency and queries per request for every route."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = _QueryCounter()
+        started = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        route = route_label(request)
+        REQUESTS.labels(route, request.method, str(response.status_code)).inc()
+        REQUEST_SECONDS.labels(route, request.method).observe(elapsed)
+        REQUEST_QUERIES.labels(route, request.method).observe(queries.count)
+        return response
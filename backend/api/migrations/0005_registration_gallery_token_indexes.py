@@ -0,0 +1,69 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_visitorregistration_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['-created_at'], name='category_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_date'], name='event_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['is_active', 'start_date'], name='event_active_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibitorregistration',
+            index=models.Index(fields=['-created_at', '-id'], name='exhibitor_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibitorregistration',
+            index=models.Index(fields=['status', '-created_at'], name='exhibitor_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibitorregistration',
+            index=models.Index(fields=['product_category', '-created_at'], name='exhibitor_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibitorregistration',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['-created_at', '-id'], name='exhibitor_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['display_order', '-created_at'], name='gallery_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['type', 'display_order', '-created_at'], name='gallery_type_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='passwordsetuptoken',
+            index=models.Index(fields=['created_at'], name='token_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='visitorregistration',
+            index=models.Index(fields=['-created_at', '-id'], name='visitor_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='visitorregistration',
+            index=models.Index(fields=['status', '-created_at'], name='visitor_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='visitorregistration',
+            index=models.Index(fields=['industry_interest', '-created_at'], name='visitor_industry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='visitorregistration',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['-created_at', '-id'], name='visitor_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_pendings3deletion'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='galleryimage',
+            name='gallery_order_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='galleryimage',
+            name='gallery_type_order_idx',
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['display_order', '-created_at', '-id'], name='gallery_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['type', 'display_order', '-created_at', '-id'], name='gallery_type_order_idx'),
+        ),
+    ]
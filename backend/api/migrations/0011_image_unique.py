@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_gallery_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='category',
+            constraint=models.UniqueConstraint(condition=models.Q(('image', ''), _negated=True), fields=('image',), name='category_image_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='galleryimage',
+            constraint=models.UniqueConstraint(condition=models.Q(('image', ''), _negated=True), fields=('image',), name='gallery_image_unique'),
+        ),
+    ]
@@ -0,0 +1,568 @@
+import hashlib
+import json
+import mimetypes
+import os
+from functools import partial
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework import status as http_status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import JSONParser, MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .caching import cache_timeout, invalidate_model_cache, model_namespace, record_cache_lookup, versioned_key
+from .exports import EXPORT_FORMATS, stream_export
+from .fastrows import compile_row_plan
+from .filters import filter_registrations
+from .importers import import_registrations_csv
+from .pagination import KeysetPagination
+from .s3_deletions import queue_s3_deletion
+from .stats import registration_stats
+from .timing import timed
+from .utils import (
+    build_public_url,
+    head_s3_object,
+    new_s3_key,
+    presign_upload,
+    store_images,
+    store_variants_later,
+)
+
+
+# ======================================================
+# VIEWSET MIXINS
+# ======================================================
+class CacheInvalidationMixin:
+    """
+    Bumps the model's cache version after every write made through the
+    viewset, so cached stats / responses derived from it are dropped.
+    """
+
+    def perform_create(self, serializer, **save_kwargs):
+        serializer.save(**save_kwargs)
+        invalidate_model_cache(self.queryset.model)
+
+    def perform_update(self, serializer, **save_kwargs):
+        serializer.save(**save_kwargs)
+        invalidate_model_cache(self.queryset.model)
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        invalidate_model_cache(self.queryset.model)
+
+
+class SparseFieldsMixin:
+    """
+    Loads only the columns a ?fields= / ?omit= response needs
+    (see serializers.DynamicFieldsMixin). The primary key and the
+    ordering columns are always loaded.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        params = self.request.query_params
+        if self.request.method != "GET" or not ("fields" in params or "omit" in params):
+            return queryset
+
+        columns = self.get_serializer().model_columns()
+        if columns is None:
+            return queryset
+
+        ordering = list(queryset.query.order_by) + list(getattr(self, "keyset_ordering", ()))
+        columns |= {name.lstrip("-") for name in ordering if isinstance(name, str)}
+        columns.add(queryset.model._meta.pk.name)
+        return queryset.only(*columns)
+
+
+class FastListMixin:
+    """
+    list() straight from .values() rows through converters precompiled
+    from the serializer (api.fastrows), skipping model instances and
+    per-row serializer work. The JSON is identical to the serializer's;
+    serializers it cannot reproduce fall back to the regular path.
+    """
+
+    def list(self, request, *args, **kwargs):
+        plan = compile_row_plan(self.get_serializer())
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = list(queryset.query.order_by) + list(getattr(self, "keyset_ordering", ()))
+        columns = plan.columns | {name.lstrip("-") for name in ordering if isinstance(name, str)}
+        rows = queryset.values(*columns)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            with timed("serialize"):
+                data = plan.render(page)
+            return self.get_paginated_response(data)
+        rows = list(rows)
+        with timed("serialize"):
+            return Response(plan.render(rows))
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified validation for list and retrieve.
+
+    The validators come from one aggregate query, MAX(updated_at) and
+    COUNT(*) over the filtered queryset (or the row's updated_at for a
+    detail view), so a matching If-None-Match is answered with 304 before
+    anything is serialized. If-Modified-Since is honoured on detail views
+    only; lists are validated by ETag.
+
+    Cached lists (CachedListMixin) use the ETag stored with the cached
+    payload instead, so a hit costs no query. Keyset pages are not
+    validated: the aggregate would cost more than the page itself.
+    """
+
+    def _validators(self, *parts):
+        last_modified = parts[0]
+        digest = hashlib.sha256(
+            repr((model_namespace(self.queryset.model),) + parts).encode("utf-8")
+        ).hexdigest()[:32]
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        return quote_etag(digest), timestamp
+
+    def _conditional(self, request, etag, last_modified, render):
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = render()
+
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+            # let clients keep the body but always revalidate
+            patch_cache_control(response, no_cache=True)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        def render():
+            return super(ConditionalGetMixin, self).list(request, *args, **kwargs)
+
+        if getattr(self, "etag_from_cached_payload", False):
+            response = render()
+            etag = response.get("ETag")
+            if etag is None:
+                return response
+            return self._conditional(request, etag, None, lambda: response)
+        if hasattr(self, "wants_cursor_pagination") and self.wants_cursor_pagination():
+            return render()
+
+        summary = (
+            self.filter_queryset(self.get_queryset())
+            .order_by()
+            .aggregate(last_modified=Max("updated_at"), count=Count("pk"))
+        )
+        etag, _ = self._validators(
+            summary["last_modified"], summary["count"], request.get_full_path()
+        )
+        # no Last-Modified: deleting an older row leaves MAX(updated_at) as it
+        # was, so If-Modified-Since alone would get a stale 304
+        return self._conditional(request, etag, None, render)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        updated_at = (
+            self.filter_queryset(self.get_queryset())
+            .filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        if updated_at is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        etag, last_modified = self._validators(
+            updated_at, kwargs[lookup_url_kwarg], request.get_full_path()
+        )
+        return self._conditional(
+            request, etag, last_modified,
+            lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs),
+        )
+
+
+class CachedListMixin:
+    """
+    Serves list responses from the cache. Keys embed the model version
+    (bumped by CacheInvalidationMixin), so a write is visible on the next
+    request. Responses carry X-Cache: HIT / MISS and an ETag hashed from
+    the payload, which ConditionalGetMixin validates against.
+    """
+    etag_from_cached_payload = True
+
+    def list(self, request, *args, **kwargs):
+        namespace = model_namespace(self.queryset.model)
+        key = versioned_key(namespace, "list", request.build_absolute_uri())
+
+        cached = cache.get(key)
+        record_cache_lookup(namespace, hit=cached is not None)
+        if cached is not None:
+            data, etag = cached
+            response = Response(data)
+            response["ETag"] = etag
+            response["X-Cache"] = "HIT"
+            return response
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            # from the content, not the key: workers with their own version
+            # counters still agree on the ETag of identical data
+            blob = json.dumps(response.data, cls=DjangoJSONEncoder, sort_keys=True).encode("utf-8")
+            etag = quote_etag(hashlib.md5(blob).hexdigest())
+            cache.set(key, (response.data, etag), cache_timeout(settings.RESPONSE_CACHE_TIMEOUT))
+            response["ETag"] = etag
+        response["X-Cache"] = "MISS"
+        return response
+
+
+class CursorPaginationMixin:
+    """
+    Opt-in keyset pagination for list endpoints. Sending ?pagination=cursor
+    (or following a returned ?cursor= link) swaps the default page-number
+    paginator for KeysetPagination over `keyset_ordering`.
+    """
+    keyset_ordering = ("-created_at", "-id")
+
+    def wants_cursor_pagination(self):
+        request = getattr(self, "request", None)
+        if request is None:
+            return False
+        params = request.query_params
+        return params.get("pagination") == "cursor" or KeysetPagination.cursor_query_param in params
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and self.wants_cursor_pagination():
+            self._paginator = KeysetPagination()
+        return super().paginator
+
+
+class RegistrationFilterMixin:
+    """
+    ?status=, ?category= and ?date_from= / ?date_to= on the list endpoint.
+    `category_field` names the column that ?category= matches.
+    """
+    category_field = None
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action in ("list", "export"):
+            queryset = filter_registrations(queryset, self.request.query_params, self.category_field)
+        return queryset
+
+
+class RegistrationExportMixin:
+    """
+    GET <list-url>/export/?output=csv|ndjson streams every row matching
+    the list filters. `export_fields` sets the columns and their order.
+    """
+    export_fields = ()
+    export_filename = "export"
+
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    def export(self, request):
+        export_format = request.query_params.get("output", "csv")
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError({"output": f"Choose one of: {', '.join(EXPORT_FORMATS)}"})
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return stream_export(queryset, self.export_fields, export_format, self.export_filename)
+
+
+class RegistrationBulkStatusMixin:
+    """
+    POST <list-url>/bulk-status/ sets one status on many rows with a single
+    UPDATE. Body: {"status": "...", "ids": [...]} or
+    {"status": "...", "filter": {"status": ..., "category": ..., "date_from": ..., "date_to": ...}}
+    Responds with per-id results and the refreshed funnel stats (`stats_kind`).
+    """
+    stats_kind = None
+
+    @action(detail=False, methods=["post"], url_path="bulk-status", permission_classes=[IsAuthenticated])
+    def bulk_status(self, request):
+        model = self.queryset.model
+        status = request.data.get("status")
+        if status not in {value for value, _ in model.STATUS_CHOICES}:
+            raise ValidationError({"status": "Invalid status"})
+
+        queryset, requested = self._bulk_status_target(model, request.data)
+
+        with transaction.atomic():
+            current = dict(queryset.select_for_update().values_list("id", "status"))
+            updated = (
+                model.objects
+                .filter(id__in=[pk for pk, old in current.items() if old != status])
+                .update(status=status, updated_at=timezone.now())
+            )
+
+        if updated:
+            invalidate_model_cache(model)
+
+        requested = requested or sorted(current, reverse=True)
+        results = [
+            {
+                "id": pk,
+                "result": "not_found" if pk not in current
+                else "unchanged" if current[pk] == status
+                else "updated",
+            }
+            for pk in requested
+        ]
+
+        return Response({
+            "status": status,
+            "updated": updated,
+            "results": results,
+            "stats": registration_stats(self.stats_kind),
+        })
+
+    def _bulk_status_target(self, model, data):
+        """(queryset, requested ids or None) for an ids- or filter-based request."""
+        ids = data.get("ids")
+        filters = data.get("filter")
+
+        if ids is not None:
+            if not isinstance(ids, list) or not ids:
+                raise ValidationError({"ids": "Provide a non-empty list of ids"})
+            if len(ids) > settings.BULK_STATUS_MAX_ROWS:
+                raise ValidationError({"ids": f"At most {settings.BULK_STATUS_MAX_ROWS} ids per request"})
+            try:
+                requested = list(dict.fromkeys(int(pk) for pk in ids))
+            except (TypeError, ValueError):
+                raise ValidationError({"ids": "Ids must be integers"})
+            return model.objects.filter(id__in=requested), requested
+
+        if isinstance(filters, dict) and filters:
+            queryset = filter_registrations(model.objects.all(), filters, self.category_field)
+            if queryset.count() > settings.BULK_STATUS_MAX_ROWS:
+                raise ValidationError({"filter": f"Filter matches more than {settings.BULK_STATUS_MAX_ROWS} rows"})
+            return queryset, None
+
+        raise ValidationError({"detail": "Provide either ids or a non-empty filter"})
+
+
+class RegistrationImportMixin:
+    """
+    POST <list-url>/import/ with a multipart `file` (CSV, header row named
+    after the model fields) bulk-inserts registrations of `stats_kind`.
+    """
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+        permission_classes=[IsAuthenticated],
+    )
+    def import_csv(self, request):
+        upload = request.FILES.get("file")
+        if not upload:
+            raise ValidationError({"file": "CSV file required"})
+
+        try:
+            report = import_registrations_csv(self.stats_kind, upload.file)
+        except UnicodeDecodeError:
+            raise ValidationError({"file": "File must be UTF-8 encoded CSV"})
+
+        return Response(report)
+
+
+class GalleryBatchUploadMixin:
+    """
+    POST <list-url>/batch/ with several multipart `images` plus shared
+    `type`, `display_order` (of the first file, then +1 per file),
+    `title` and `description`. Files are uploaded in parallel and the rows
+    are created with one bulk_create. Responds with a result per file.
+    """
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="batch",
+        parser_classes=[MultiPartParser],
+        permission_classes=[IsAuthenticated],
+    )
+    def batch_upload(self, request):
+        files = request.FILES.getlist("images")
+        if not files:
+            raise ValidationError({"images": "At least one image file required"})
+        if len(files) > settings.GALLERY_BATCH_MAX_FILES:
+            raise ValidationError({"images": f"At most {settings.GALLERY_BATCH_MAX_FILES} files per request"})
+
+        try:
+            start = int(request.data.get("display_order", 1))
+        except (TypeError, ValueError):
+            raise ValidationError({"display_order": "Must be an integer"})
+
+        results = [{"file": file_obj.name} for file_obj in files]
+        pending = []  # (result, file, validated_data)
+
+        # validate every row before anything is uploaded
+        for offset, (result, file_obj) in enumerate(zip(results, files)):
+            if not (file_obj.content_type or "").startswith("image/"):
+                result.update(status="failed", errors={"image": ["Not an image file"]})
+                continue
+
+            title = request.data.get("title") or os.path.splitext(file_obj.name)[0][:200]
+            serializer = self.get_serializer(data={
+                "title": title,
+                "description": request.data.get("description") or title,
+                "type": request.data.get("type", "gallery"),
+                "display_order": start + offset,
+            })
+            if serializer.is_valid():
+                pending.append((result, file_obj, serializer.validated_data))
+            else:
+                result.update(status="failed", errors=serializer.errors)
+
+        model = self.queryset.model
+        instances = []
+        stored = store_images([file_obj for _, file_obj, _ in pending], folder="gallery")
+        for (result, _, data), outcome in zip(pending, stored):
+            if isinstance(outcome, Exception):
+                result.update(status="failed", errors={"image": [f"Upload failed: {outcome}"]})
+                continue
+            url, variants = outcome
+            instances.append((result, model(**data, image=url, image_variants=variants)))
+
+        if instances:
+            model.objects.bulk_create([instance for _, instance in instances])
+            invalidate_model_cache(model)
+
+        for result, instance in instances:
+            result.update(status="created", data=self.get_serializer(instance).data)
+
+        return Response({
+            "created": len(instances),
+            "failed": len(results) - len(instances),
+            "results": results,
+        })
+
+
+class DirectUploadMixin:
+    """
+    Browser -> S3 uploads that never pass through the app server:
+
+    1. POST <list-url>/upload-url/ {"filename", "content_type", "size", "method": "post"|"put"}
+       returns a presigned POST (or PUT) for a new key under `upload_folder`
+       and a signed `token`.
+    2. The client uploads the file straight to S3.
+    3. POST <list-url>/confirm-upload/ {"token", ...row fields} checks the
+       object with HEAD and creates the row. Its image variants are added
+       in the background once the row is committed.
+
+    The multipart create endpoint keeps working as a fallback.
+    """
+    upload_folder = None
+    upload_token_salt = "api.direct-upload"
+    already_confirmed = "This upload has already been confirmed"
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="upload-url",
+        parser_classes=[JSONParser],
+        permission_classes=[IsAuthenticated],
+    )
+    def upload_url(self, request):
+        content_type = request.data.get("content_type", "")
+        if content_type not in settings.DIRECT_UPLOAD_CONTENT_TYPES:
+            raise ValidationError({"content_type": f"Choose one of: {', '.join(settings.DIRECT_UPLOAD_CONTENT_TYPES)}"})
+
+        try:
+            size = int(request.data.get("size", 0))
+        except (TypeError, ValueError):
+            raise ValidationError({"size": "Must be an integer"})
+        if size > settings.DIRECT_UPLOAD_MAX_BYTES:
+            raise ValidationError({"size": f"Files are limited to {settings.DIRECT_UPLOAD_MAX_BYTES} bytes"})
+
+        method = request.data.get("method", "post").lower()
+        if method not in ("post", "put"):
+            raise ValidationError({"method": "Choose post or put"})
+
+        file_key = new_s3_key(self.upload_folder, self._upload_filename(request.data.get("filename"), content_type))
+        token = signing.dumps({"key": file_key, "content_type": content_type}, salt=self.upload_token_salt)
+
+        return Response({
+            **presign_upload(file_key, content_type, settings.DIRECT_UPLOAD_MAX_BYTES, method),
+            "key": file_key,
+            "token": token,
+            "expires_in": settings.DIRECT_UPLOAD_EXPIRES,
+            "max_bytes": settings.DIRECT_UPLOAD_MAX_BYTES,
+        })
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="confirm-upload",
+        parser_classes=[JSONParser],
+        permission_classes=[IsAuthenticated],
+    )
+    def confirm_upload(self, request):
+        try:
+            upload = signing.loads(
+                request.data.get("token", ""),
+                salt=self.upload_token_salt,
+                max_age=settings.DIRECT_UPLOAD_CONFIRM_MAX_AGE,
+            )
+        except signing.BadSignature:
+            raise ValidationError({"token": "Invalid or expired upload token"})
+
+        file_key = upload["key"]
+        url = build_public_url(file_key)
+        model = self.queryset.model
+        # cheap early exit; the unique image constraint is the actual guard
+        if model.objects.filter(image=url).exists():
+            raise ValidationError({"token": self.already_confirmed})
+
+        head = head_s3_object(file_key)
+        if head is None:
+            raise ValidationError({"token": "The file has not been uploaded yet"})
+        if head["ContentLength"] > settings.DIRECT_UPLOAD_MAX_BYTES or head.get("ContentType") != upload["content_type"]:
+            queue_s3_deletion(url)
+            raise ValidationError({"token": "Uploaded file does not match the requested type or size limit"})
+
+        data = {field: value for field, value in request.data.items() if field != "token"}
+        data["image"] = url
+        serializer = self.get_serializer(data=data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            with transaction.atomic():
+                self.perform_create(serializer)
+        except IntegrityError:
+            raise ValidationError({"token": self.already_confirmed})
+
+        # variants come later, so the request never downloads the file
+        pk = serializer.instance.pk
+        transaction.on_commit(
+            lambda: store_variants_later(file_key, partial(self._save_variants, model, pk, url))
+        )
+        return Response(serializer.data, status=http_status.HTTP_201_CREATED)
+
+    @staticmethod
+    def _save_variants(model, pk, url, variants):
+        # skipped if the row was deleted or its image replaced meanwhile
+        if variants and model.objects.filter(pk=pk, image=url).update(
+            image_variants=variants, updated_at=timezone.now()
+        ):
+            invalidate_model_cache(model)
+
+    def _upload_filename(self, filename, content_type):
+        """Keep a short alphanumeric extension from `filename`, else derive one."""
+        extension = os.path.splitext(filename or "")[1].lstrip(".").lower()
+        if not (extension.isalnum() and len(extension) <= 5):
+            extension = (mimetypes.guess_extension(content_type) or ".bin").lstrip(".")
+        return f"upload.{extension}"
@@ -4,6 +4,8 @@ from django.utils import timezone
 from django.contrib.auth.models import AbstractUser
 from datetime import timedelta
 
+from .caching import forget_revoked_users, mark_user_deleted
+
 
 # -----------------------
 # TOKEN HELPER
@@ -37,6 +39,15 @@ class User(AbstractUser):
         if self.is_superuser:
             self.role = self.ROLE_ADMIN
         super().save(*args, **kwargs)
+        # refresh the revoked set behind stateless JWT auth (api.authentication);
+        # logins only touch last_login
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "is_active" in update_fields:
+            forget_revoked_users()
+
+    def delete(self, *args, **kwargs):
+        mark_user_deleted(self.pk)
+        return super().delete(*args, **kwargs)
 
     def mark_password_set(self):
         self.is_password_set = True
@@ -55,6 +66,12 @@ class PasswordSetupToken(models.Model):
     token = models.CharField(max_length=255, default=generate_token, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # expiry checks / cleanup scan by age
+            models.Index(fields=["created_at"], name="token_created_idx"),
+        ]
+
     def is_valid(self):
         return timezone.now() - self.created_at < timedelta(days=1)
 
@@ -86,6 +103,19 @@ class ExhibitorRegistration(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # list ordering + keyset pagination
+            models.Index(fields=["-created_at", "-id"], name="exhibitor_created_idx"),
+            # dashboard status filter / stats
+            models.Index(fields=["status", "-created_at"], name="exhibitor_status_created_idx"),
+            models.Index(fields=["product_category", "-created_at"], name="exhibitor_category_idx"),
+            # sales work queue (small: only pending rows)
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(status="pending"),
+                name="exhibitor_pending_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.company_name} - {self.contact_person_name}"
@@ -114,6 +144,19 @@ class VisitorRegistration(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # list ordering + keyset pagination
+            models.Index(fields=["-created_at", "-id"], name="visitor_created_idx"),
+            # dashboard status filter / stats
+            models.Index(fields=["status", "-created_at"], name="visitor_status_created_idx"),
+            models.Index(fields=["industry_interest", "-created_at"], name="visitor_industry_idx"),
+            # sales work queue (small: only pending rows)
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(status="pending"),
+                name="visitor_pending_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} - {self.company_name}"
@@ -127,11 +170,20 @@ class Category(models.Model):
     description = models.TextField()
     icon = models.CharField(max_length=10)
     image = models.URLField(max_length=500, null=True, blank=True)
+    # {"320w": url, "640w": url, ...} resized copies of `image`
+    image_variants = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Categories"
+        indexes = [
+            models.Index(fields=["-created_at"], name="category_created_idx"),
+        ]
+        constraints = [
+            # one row per uploaded object; confirm-upload relies on it against replays
+            models.UniqueConstraint(fields=["image"], condition=~models.Q(image=""), name="category_image_unique"),
+        ]
 
     def __str__(self):
         return self.name
@@ -158,6 +210,11 @@ class Event(models.Model):
 
     class Meta:
         ordering = ['start_date']
+        indexes = [
+            models.Index(fields=["start_date"], name="event_start_idx"),
+            # active event lookup
+            models.Index(fields=["is_active", "start_date"], name="event_active_start_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -176,6 +233,8 @@ class GalleryImage(models.Model):
 
     title = models.CharField(max_length=200)
     image = models.URLField(max_length=500, null=True, blank=True)
+    # {"320w": url, "640w": url, ...} resized copies of `image`
+    image_variants = models.JSONField(default=dict, blank=True)
     description = models.TextField()
 
     # Restored fields
@@ -188,6 +247,96 @@ class GalleryImage(models.Model):
     class Meta:
         verbose_name_plural = "Gallery Images"
         ordering = ["display_order", "-created_at"]
+        indexes = [
+            # -id closes the keyset ordering, so pages need no extra sort step
+            models.Index(fields=["display_order", "-created_at", "-id"], name="gallery_order_idx"),
+            # per-type listing (carousel / banner / ...)
+            models.Index(fields=["type", "display_order", "-created_at", "-id"], name="gallery_type_order_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["image"], condition=~models.Q(image=""), name="gallery_image_unique"),
+        ]
 
     def __str__(self):
         return self.title
+
+
+# =====================================================
+# OUTBOUND EMAIL QUEUE (drained by `manage.py send_queued_email`)
+# =====================================================
+class OutboundEmail(models.Model):
+    STATUS_PENDING = "pending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+
+    STATUS_CHOICES = (
+        (STATUS_PENDING, "Pending"),
+        (STATUS_SENT, "Sent"),
+        (STATUS_FAILED, "Failed"),
+    )
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255)
+    recipients = models.JSONField(default=list)
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            # worker poll: due pending messages only
+            models.Index(
+                fields=["next_attempt_at"],
+                condition=models.Q(status="pending"),
+                name="outbox_due_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.recipients)} ({self.status})"
+
+
+# =====================================================
+# ONE-TIME PASSCODES (DatabaseOTPStore)
+# =====================================================
+class OTPCode(models.Model):
+    email = models.EmailField(unique=True)
+    code = models.CharField(max_length=10)
+    attempts = models.PositiveIntegerField(default=0)
+    expires_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["expires_at"], name="otp_expires_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.email} (expires {self.expires_at:%Y-%m-%d %H:%M})"
+
+
+# =====================================================
+# DEFERRED S3 DELETIONS (api.s3_deletions)
+# =====================================================
+class PendingS3Deletion(models.Model):
+    key = models.CharField(max_length=1024, unique=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["next_attempt_at"], name="s3_deletion_due_idx"),
+        ]
+
+    def __str__(self):
+        return self.key
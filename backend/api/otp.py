@@ -0,0 +1,137 @@
+import hashlib
+import hmac
+import secrets
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import OTPCode
+
+
+# ======================================================
+# OTP STORE
+# ======================================================
+# Results of OTPStore.check()
+OTP_OK = "ok"
+OTP_MISSING = "missing"   # never issued, expired or discarded
+OTP_INVALID = "invalid"
+OTP_LOCKED = "locked"     # too many attempts; a new code must be requested
+
+
+def generate_otp():
+    return f"{secrets.randbelow(900000) + 100000}"
+
+
+def _normalize(email):
+    return email.strip().lower()
+
+
+def _matches(expected, submitted):
+    return hmac.compare_digest(str(expected), str(submitted).strip())
+
+
+class OTPStore(ABC):
+    """
+    Where issued OTPs live between send_otp and create_password.
+    Implementations must be shared by all worker processes, expire codes
+    after `ttl` seconds on their own and count attempts atomically.
+    """
+
+    def __init__(self):
+        self.ttl = settings.OTP_TTL_SECONDS
+        self.max_attempts = settings.OTP_MAX_ATTEMPTS
+
+    @abstractmethod
+    def issue(self, email, code):
+        """Store `code` for `email`, replacing any previous one."""
+
+    @abstractmethod
+    def check(self, email, code):
+        """Count one attempt and return one of the OTP_* results."""
+
+    @abstractmethod
+    def discard(self, email):
+        """Forget the code for `email`."""
+
+    def _result(self, expected, attempts, submitted):
+        if attempts > self.max_attempts:
+            return OTP_LOCKED
+        return OTP_OK if _matches(expected, submitted) else OTP_INVALID
+
+
+class CacheOTPStore(OTPStore):
+    """
+    Django cache backed store. Needs a shared cache (Redis / Memcached /
+    database cache) when several workers serve the OTP endpoints.
+    """
+
+    def _keys(self, email):
+        digest = hashlib.sha256(_normalize(email).encode("utf-8")).hexdigest()
+        return f"otp:code:{digest}", f"otp:attempts:{digest}"
+
+    def issue(self, email, code):
+        code_key, attempts_key = self._keys(email)
+        cache.set_many({code_key: code, attempts_key: 0}, timeout=self.ttl)
+
+    def check(self, email, code):
+        code_key, attempts_key = self._keys(email)
+        expected = cache.get(code_key)
+        if expected is None:
+            return OTP_MISSING
+
+        try:
+            attempts = cache.incr(attempts_key)
+        except ValueError:
+            # counter evicted while the code survived: restart it
+            cache.add(attempts_key, 1, timeout=self.ttl)
+            attempts = 1
+
+        return self._result(expected, attempts, code)
+
+    def discard(self, email):
+        cache.delete_many(self._keys(email))
+
+
+class DatabaseOTPStore(OTPStore):
+    """
+    Stores codes in the OTPCode table. Works across workers with no extra
+    infrastructure; expired rows are purged whenever a new code is issued.
+    """
+
+    def issue(self, email, code):
+        now = timezone.now()
+        OTPCode.objects.filter(expires_at__lte=now).delete()
+        OTPCode.objects.update_or_create(
+            email=_normalize(email),
+            defaults={
+                "code": code,
+                "attempts": 0,
+                "expires_at": now + timedelta(seconds=self.ttl),
+            },
+        )
+
+    def check(self, email, code):
+        live = OTPCode.objects.filter(email=_normalize(email), expires_at__gt=timezone.now())
+
+        # atomic increment first, so concurrent guesses are all counted
+        if not live.update(attempts=F("attempts") + 1):
+            return OTP_MISSING
+
+        entry = live.values_list("code", "attempts").first()
+        if entry is None:
+            return OTP_MISSING
+        return self._result(*entry, code)
+
+    def discard(self, email):
+        OTPCode.objects.filter(email=_normalize(email)).delete()
+
+
+@lru_cache(maxsize=None)
+def get_otp_store():
+    return import_string(settings.OTP_STORE_BACKEND)()
@@ -0,0 +1,174 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+# ======================================================
+# KEYSET (CURSOR) PAGINATION
+# ======================================================
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over a composite ordering such as ("-created_at", "-id").
+
+    The cursor carries the ordering values of the boundary row, so each page
+    is one range scan on the ordering index: no OFFSET and no COUNT(*), and
+    page 1000 costs the same as page 1. Ordering fields must be non-null and
+    the last one unique (the primary key) so the order is total.
+    """
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.model = queryset.model
+        self.fields = [
+            (name.lstrip("-"), name.startswith("-"))
+            for name in getattr(view, "keyset_ordering", self.ordering)
+        ]
+
+        position, reverse = self.decode_cursor(request)
+
+        # walking backwards = flip every direction, then flip the rows back
+        order_by = [
+            f"-{name}" if desc != reverse else name
+            for name, desc in self.fields
+        ]
+        queryset = queryset.order_by(*order_by)
+        if position is not None:
+            queryset = queryset.filter(self.boundary_filter(position, reverse))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_previous, self.has_next = has_more, position is not None
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size,
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    # ------------------------------
+    # boundary filter
+    # ------------------------------
+    def boundary_filter(self, position, reverse):
+        """
+        Rows strictly after `position` in the (possibly flipped) ordering:
+        (a > x) OR (a = x AND b > y) OR ...  The leading a >= x range is
+        repeated outside the OR so the planner can seek on the index.
+        """
+        def lookup(desc, inclusive=False):
+            op = "lt" if desc != reverse else "gt"
+            return f"{op}e" if inclusive else op
+
+        after = Q()
+        for index, (name, desc) in enumerate(self.fields):
+            clause = Q(**{f"{name}__{lookup(desc)}": position[index]})
+            for prev_index, (prev_name, _) in enumerate(self.fields[:index]):
+                clause &= Q(**{prev_name: position[prev_index]})
+            after |= clause
+
+        first_name, first_desc = self.fields[0]
+        leading = Q(**{f"{first_name}__{lookup(first_desc, inclusive=True)}": position[0]})
+        return leading & after
+
+    # ------------------------------
+    # cursors
+    # ------------------------------
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            values = payload["p"]
+            if len(values) != len(self.fields):
+                raise ValueError
+            position = [
+                self.model._meta.get_field(name).to_python(value)
+                for (name, _), value in zip(self.fields, values)
+            ]
+        except (TypeError, ValueError, KeyError, binascii.Error, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if any(value is None for value in position):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, bool(payload.get("r"))
+
+    def encode_cursor(self, row, reverse):
+        values = []
+        for name, _ in self.fields:
+            attname = self.model._meta.get_field(name).attname
+            # rows are model instances, or dicts on the .values() fast path
+            value = row[attname] if isinstance(row, dict) else getattr(row, attname)
+            if isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            values.append(value)
+
+        payload = {"p": values}
+        if reverse:
+            payload["r"] = 1
+
+        encoded = base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
@@ -0,0 +1,163 @@
+import logging
+import os
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from .models import PendingS3Deletion
+from .utils import get_s3_client, key_from_url, s3_call
+
+# DeleteObjects accepts at most this many keys per call
+DELETE_OBJECTS_MAX_KEYS = 1000
+# A claimed batch is due again after this long, in case its flush died
+CLAIM_TIMEOUT = timedelta(minutes=5)
+
+logger = logging.getLogger(__name__)
+
+
+# ======================================================
+# QUEUE: record in the request, delete after commit
+# ======================================================
+def queue_s3_deletion(*file_urls):
+    """
+    Queue the objects behind `file_urls` for deletion. The rows are part
+    of the caller's transaction, so a rolled back delete keeps its files.
+    Returns the number of keys queued.
+    """
+    keys = {key_from_url(file_url) for file_url in file_urls} - {None}
+    if not keys:
+        return 0
+
+    PendingS3Deletion.objects.bulk_create(
+        [PendingS3Deletion(key=key) for key in keys],
+        ignore_conflicts=True,
+    )
+    if settings.S3_DELETE_IN_BACKGROUND:
+        transaction.on_commit(wake_flush_thread)
+    return len(keys)
+
+
+def delete_image_files(image_url, variants=None):
+    """Queue an original and all of its variants for deletion."""
+    return queue_s3_deletion(image_url, *(variants or {}).values())
+
+
+# ======================================================
+# FLUSH
+# ======================================================
+def retry_delay(attempts):
+    """Exponential backoff: base, 2x base, 4x base ... capped."""
+    delay = settings.S3_DELETE_RETRY_BASE_DELAY * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(delay, settings.S3_DELETE_RETRY_MAX_DELAY))
+
+
+def delete_keys(keys):
+    """DeleteObjects in groups of up to 1000 keys. Returns {key: error} for failures."""
+    client = get_s3_client()
+    failed = {}
+
+    for start in range(0, len(keys), DELETE_OBJECTS_MAX_KEYS):
+        chunk = keys[start:start + DELETE_OBJECTS_MAX_KEYS]
+        try:
+            with s3_call("delete_objects"):
+                response = client.delete_objects(
+                    Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                    Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True},
+                )
+        except Exception as exc:
+            failed.update((key, str(exc)) for key in chunk)
+            continue
+
+        # Quiet mode only reports the keys that could not be deleted
+        for error in response.get("Errors", []):
+            failed[error["Key"]] = f"{error.get('Code')}: {error.get('Message')}"
+
+    return failed
+
+
+def claim_due_deletions(batch_size):
+    """
+    Lock up to `batch_size` due rows with SKIP LOCKED (PostgreSQL), count
+    the attempt and push them CLAIM_TIMEOUT into the future, then commit.
+    No other flush picks the batch up while its S3 calls run.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            PendingS3Deletion.objects
+            .select_for_update(skip_locked=True)
+            .filter(next_attempt_at__lte=now)
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        for pending in batch:
+            pending.attempts += 1
+            pending.next_attempt_at = now + CLAIM_TIMEOUT
+        PendingS3Deletion.objects.bulk_update(batch, ["attempts", "next_attempt_at"])
+    return batch
+
+
+def flush_s3_deletions(batch_size=None):
+    """
+    Delete one batch of due keys. Returns {"deleted": n, "retrying": n}.
+
+    The batch is claimed in a short transaction first, so DeleteObjects
+    runs without holding a transaction or row locks, and the background
+    thread and the management command never delete the same key twice.
+    """
+    batch = claim_due_deletions(batch_size or settings.S3_DELETE_BATCH_SIZE)
+    if not batch:
+        return {"deleted": 0, "retrying": 0}
+
+    failed = delete_keys([pending.key for pending in batch])
+
+    now = timezone.now()
+    retrying = [pending for pending in batch if pending.key in failed]
+    for pending in retrying:
+        pending.last_error = failed[pending.key][:2000]
+        pending.next_attempt_at = now + retry_delay(pending.attempts)
+
+    with transaction.atomic():
+        PendingS3Deletion.objects.filter(
+            pk__in=[pending.pk for pending in batch if pending.key not in failed]
+        ).delete()
+        PendingS3Deletion.objects.bulk_update(retrying, ["last_error", "next_attempt_at"])
+
+    return {"deleted": len(batch) - len(retrying), "retrying": len(retrying)}
+
+
+# ======================================================
+# BACKGROUND THREAD (one per worker process)
+# ======================================================
+_wakeup = threading.Event()
+_flush_thread = None
+_flush_thread_pid = None
+_flush_thread_lock = threading.Lock()
+
+
+def _flush_loop():
+    while True:
+        _wakeup.wait()
+        _wakeup.clear()
+        try:
+            # keep going while full batches come back
+            while sum(flush_s3_deletions().values()) >= settings.S3_DELETE_BATCH_SIZE:
+                pass
+        except Exception:
+            logger.exception("Flushing S3 deletions failed")
+        finally:
+            connections.close_all()
+
+
+def wake_flush_thread():
+    """Start (once per process) or wake the thread that flushes due deletions."""
+    global _flush_thread, _flush_thread_pid
+
+    with _flush_thread_lock:
+        if _flush_thread is None or _flush_thread_pid != os.getpid():
+            _flush_thread = threading.Thread(target=_flush_loop, name="s3-deletions", daemon=True)
+            _flush_thread.start()
+            _flush_thread_pid = os.getpid()
+    _wakeup.set()
@@ -7,41 +7,125 @@ from .models import (
     GalleryImage,
     User,
 )
+from .timing import timed
+
+# =====================================================
+# SHARED FIELD RULES (serializers + bulk import)
+# =====================================================
+def clean_email_address(value):
+    if not value:
+        raise serializers.ValidationError("Email address is required")
+    return value.lower()
+
+
+def clean_phone_number(value, label="Phone number"):
+    if not value:
+        raise serializers.ValidationError(f"{label} is required")
+
+    cleaned = "".join(filter(str.isdigit, value))
+    if len(cleaned) < 10:
+        raise serializers.ValidationError(f"{label} must be at least 10 digits")
+
+    return value
+
+
+# =====================================================
+# SERIALIZE TIME (Server-Timing, api.timing)
+# =====================================================
+class TimedSerializerMixin:
+    """Building .data of one object counts as "serialize" time."""
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+
+class TimedListSerializer(serializers.ListSerializer):
+    """The many=True counterpart; set it as Meta.list_serializer_class."""
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+
+# =====================================================
+# SPARSE FIELDSETS (?fields= / ?omit=)
+# =====================================================
+def parse_field_list(value):
+    return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+
+class DynamicFieldsMixin:
+    """
+    Limits the output to ?fields=a,b or drops ?omit=a,b on GET requests.
+    `fields` / `omit` can also be passed as keyword arguments.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        omit = kwargs.pop("omit", None)
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get("request")
+        if fields is None and omit is None and request is not None and request.method == "GET":
+            fields = parse_field_list(request.query_params.get("fields")) or None
+            omit = parse_field_list(request.query_params.get("omit"))
+
+        requested = set(fields or ()) | set(omit or ())
+        unknown = requested - set(self.fields)
+        if unknown:
+            raise serializers.ValidationError(
+                {"fields": f"Unknown fields: {', '.join(sorted(unknown))}. Choose from: {', '.join(self.fields)}"}
+            )
+
+        keep = set(fields) if fields else set(self.fields)
+        for name in list(self.fields):
+            if name not in keep or name in (omit or ()):
+                self.fields.pop(name)
+
+    def model_columns(self):
+        """
+        Model field names the remaining fields read, for QuerySet.only().
+        None when a field does not map onto a single concrete column.
+        """
+        concrete = {field.name for field in self.Meta.model._meta.concrete_fields}
+        columns = set()
+        for field in self.fields.values():
+            if field.source not in concrete:
+                return None
+            columns.add(field.source)
+        return columns
+
 
 # =====================================================
 # EXHIBITOR SERIALIZER (Matches NEW Model)
 # =====================================================
-class ExhibitorRegistrationSerializer(serializers.ModelSerializer):
+class ExhibitorRegistrationSerializer(TimedSerializerMixin, DynamicFieldsMixin, serializers.ModelSerializer):
 
     class Meta:
         model = ExhibitorRegistration
+        list_serializer_class = TimedListSerializer
         fields = '__all__'
         read_only_fields = ('id', 'created_at', 'updated_at')
 
     # field validation
     def validate_email_address(self, value):
-        if not value:
-            raise serializers.ValidationError("Email address is required")
-        return value.lower()
+        return clean_email_address(value)
 
     def validate_contact_number(self, value):
-        if not value:
-            raise serializers.ValidationError("Contact number is required")
-
-        cleaned = "".join(filter(str.isdigit, value))
-        if len(cleaned) < 10:
-            raise serializers.ValidationError("Contact number must be at least 10 digits")
-
-        return value
+        return clean_phone_number(value, label="Contact number")
 
 
 # =====================================================
 # VISITOR SERIALIZER (Matches NEW Model)
 # =====================================================
-class VisitorRegistrationSerializer(serializers.ModelSerializer):
+class VisitorRegistrationSerializer(TimedSerializerMixin, DynamicFieldsMixin, serializers.ModelSerializer):
 
     class Meta:
         model = VisitorRegistration
+        list_serializer_class = TimedListSerializer
         fields = [
             "id",
             "first_name",
@@ -57,71 +141,70 @@ class VisitorRegistrationSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at", "updated_at")
 
     def validate_email_address(self, value):
-        if not value:
-            raise serializers.ValidationError("Email address is required")
-        return value.lower()
+        return clean_email_address(value)
 
     def validate_phone_number(self, value):
-        if not value:
-            raise serializers.ValidationError("Phone number is required")
-
-        cleaned = "".join(filter(str.isdigit, value))
-        if len(cleaned) < 10:
-            raise serializers.ValidationError("Phone number must be at least 10 digits")
-
-        return value
+        return clean_phone_number(value, label="Phone number")
 
 
 # =====================================================
 # CATEGORY SERIALIZER
 # =====================================================
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(TimedSerializerMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
+        list_serializer_class = TimedListSerializer
         fields = [
             "id",
             "name",
             "description",
             "icon",
             "image",
+            "image_variants",
             "created_at",
             "updated_at",
         ]
+        read_only_fields = ("image_variants",)
 
 
 # =====================================================
 # EVENT SERIALIZER
 # =====================================================
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(TimedSerializerMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Event
+        list_serializer_class = TimedListSerializer
         fields = '__all__'
 
 
 # =====================================================
 # GALLERY SERIALIZER
 # =====================================================
-class GalleryImageSerializer(serializers.ModelSerializer):
+class GalleryImageSerializer(TimedSerializerMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = GalleryImage
+        list_serializer_class = TimedListSerializer
         fields = [
             "id",
             "title",
             "description",
             "image",
+            "image_variants",
             "type",
             "display_order",
             "created_at",
             "updated_at",
         ]
+        read_only_fields = ("image_variants",)
 
 
 # =====================================================
 # USER SERIALIZER
 # =====================================================
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(TimedSerializerMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
+        list_serializer_class = TimedListSerializer
         fields = [
             "id",
             "username",
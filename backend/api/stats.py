@@ -0,0 +1,89 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .caching import cache_timeout, model_namespace, versioned_key
+from .filters import filter_by_date_range
+from .models import ExhibitorRegistration, VisitorRegistration
+
+
+# ======================================================
+# REGISTRATION FUNNEL STATS
+# ======================================================
+# kind -> (model, grouped column, response key)
+REGISTRATION_KINDS = {
+    "exhibitors": (ExhibitorRegistration, "product_category", "by_category"),
+    "visitors": (VisitorRegistration, "industry_interest", "by_industry"),
+}
+
+BUCKET_DAY = "day"
+
+
+def _status_counts(queryset, statuses):
+    counts = dict.fromkeys(statuses, 0)
+    for status, total in queryset.values_list("status").annotate(total=Count("id")).order_by():
+        counts[status] = total
+    return counts
+
+
+def _group_counts(queryset, field):
+    rows = queryset.values_list(field).annotate(total=Count("id")).order_by("-total", field)
+    return {value: total for value, total in rows}
+
+
+def _daily_counts(queryset, statuses):
+    rows = (
+        queryset
+        .annotate(day=TruncDate("created_at", tzinfo=timezone.get_current_timezone()))
+        .values_list("day", "status")
+        .annotate(total=Count("id"))
+        .order_by("day")
+    )
+
+    buckets = {}
+    for day, status, total in rows:
+        bucket = buckets.setdefault(day, {
+            "date": day.isoformat(),
+            "total": 0,
+            "by_status": dict.fromkeys(statuses, 0),
+        })
+        bucket["total"] += total
+        bucket["by_status"][status] = total
+
+    return list(buckets.values())
+
+
+def compute_registration_stats(kind, date_from=None, date_to=None, bucket=None):
+    model, group_field, group_key = REGISTRATION_KINDS[kind]
+    statuses = [value for value, _ in model.STATUS_CHOICES]
+
+    queryset = filter_by_date_range(model.objects.all(), date_from, date_to)
+
+    by_status = _status_counts(queryset, statuses)
+    data = {
+        "total": sum(by_status.values()),
+        "by_status": by_status,
+        group_key: _group_counts(queryset, group_field),
+    }
+
+    if bucket == BUCKET_DAY:
+        data["daily"] = _daily_counts(queryset, statuses)
+
+    return data
+
+
+def registration_stats(kind, date_from=None, date_to=None, bucket=None):
+    """
+    Cached wrapper around compute_registration_stats().
+    Keys embed the model version, so any registration write invalidates them.
+    """
+    model = REGISTRATION_KINDS[kind][0]
+    key = versioned_key(model_namespace(model), "stats", date_from, date_to, bucket)
+
+    data = cache.get(key)
+    if data is None:
+        data = compute_registration_stats(kind, date_from, date_to, bucket)
+        cache.set(key, data, cache_timeout(settings.STATS_CACHE_TIMEOUT))
+    return data
@@ -0,0 +1,120 @@
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger("api.timing")
+
+
+# ======================================================
+# PER-REQUEST TIMINGS (Server-Timing header + log line)
+# ======================================================
+# Only sampled requests get a RequestTimings; elsewhere (unsampled
+# requests, management commands, workers) timed() is a no-op.
+_current = ContextVar("api_request_timings", default=None)
+
+# Server-Timing metric names, in header order
+SECTIONS = ("db", "serialize", "s3", "smtp")
+
+
+class RequestTimings:
+    """Milliseconds and call counts per section for one request."""
+
+    def __init__(self):
+        self.ms = dict.fromkeys(SECTIONS, 0.0)
+        self.calls = dict.fromkeys(SECTIONS, 0)
+        # gallery uploads add S3 time from a thread pool
+        self._lock = threading.Lock()
+
+    def add(self, section, ms):
+        with self._lock:
+            self.ms[section] = self.ms.get(section, 0.0) + ms
+            self.calls[section] = self.calls.get(section, 0) + 1
+
+
+@contextmanager
+def timed(section):
+    """Add the time spent in the block to `section` of the current request."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(section, (time.perf_counter() - started) * 1000)
+
+
+def _time_query(execute, sql, params, many, context):
+    with timed("db"):
+        return execute(sql, params, many, context)
+
+
+class ServerTimingMiddleware:
+    """
+    For a SERVER_TIMING_SAMPLE_RATE share of requests, records total time,
+    DB queries (count + time), serializer, S3 and SMTP time, then adds a
+    Server-Timing header and logs one structured line on `api.timing`.
+
+    Streaming responses (exports) are measured up to the first byte.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        rate = settings.SERVER_TIMING_SAMPLE_RATE
+        if rate <= 0 or (rate < 1 and random.random() >= rate):
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(_time_query):
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total = (time.perf_counter() - started) * 1000
+
+        response["Server-Timing"] = server_timing_header(timings, total)
+        self._log(request, response, timings, total)
+        return response
+
+    def _log(self, request, response, timings, total):
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": round(total, 2),
+            "db_queries": timings.calls["db"],
+        }
+        for section in SECTIONS:
+            fields[f"{section}_ms"] = round(timings.ms[section], 2)
+
+        # logfmt message for plain handlers, the same fields as attributes for JSON formatters
+        logger.info(
+            "request " + " ".join(f"{key}={value}" for key, value in fields.items()),
+            extra={"timing": fields},
+        )
+
+
+def server_timing_header(timings, total):
+    """
+    Sections can overlap (a lazy queryset runs inside "serialize") and
+    parallel S3 uploads add up, so they need not sum to the total.
+    """
+    parts = [f"total;dur={total:.1f}"]
+    for section in SECTIONS:
+        calls = timings.calls[section]
+        if calls:
+            unit = "queries" if section == "db" else "calls"
+            parts.append(f'{section};dur={timings.ms[section]:.1f};desc="{calls} {unit}"')
+    return ", ".join(parts)
@@ -2,7 +2,8 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
-    health_check,
+    liveness_check,
+    readiness_check,
     LoginView,               # unified JWT login
     create_admin_user,
     create_team_user,
@@ -11,6 +12,11 @@ from .views import (
     send_otp,
     verify_otp,
     create_password,
+    registration_stats_summary,
+    registration_stats_detail,
+    response_cache_stats,
+    prometheus_metrics,
+    public_bootstrap,
     ExhibitorRegistrationViewSet,
     VisitorRegistrationViewSet,
     CategoryViewSet,
@@ -27,7 +33,13 @@ router.register(r'gallery', GalleryImageViewSet, basename='gallery')
 
 urlpatterns = [
 
-    path('api/health/', health_check, name='health'),
+    # ---------------------------------
+    # Health: liveness never touches the DB; /api/health/ = readiness
+    # ---------------------------------
+    path('api/health/', readiness_check, name='health'),
+    path('api/health/live/', liveness_check, name='health-live'),
+    path('api/health/ready/', readiness_check, name='health-ready'),
+
     # ---------------------------------
     # SINGLE LOGIN ENDPOINT
     # ---------------------------------
@@ -52,6 +64,23 @@ urlpatterns = [
     path('api/password/verify-otp/', verify_otp),
     path('api/password/create/', create_password),
 
+    # ---------------------------------
+    # Public site data in one request
+    # ---------------------------------
+    path('api/bootstrap/', public_bootstrap, name='bootstrap'),
+
+    # ---------------------------------
+    # Dashboard stats
+    # ---------------------------------
+    path('api/stats/', registration_stats_summary, name='stats'),
+    path('api/stats/<str:kind>/', registration_stats_detail, name='stats-detail'),
+    path('api/cache/stats/', response_cache_stats, name='cache-stats'),
+
+    # ---------------------------------
+    # Prometheus scrape target
+    # ---------------------------------
+    path('api/metrics/', prometheus_metrics, name='metrics'),
+
     # ---------------------------------
     # CRUD router
     # ---------------------------------
@@ -1,8 +1,25 @@
+import contextvars
+import logging
+import multiprocessing
+import os
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import unquote, urlparse
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from uuid import uuid4
 from django.conf import settings
+from django.db import connections
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from rest_framework_simplejwt.tokens import RefreshToken
+
+from . import images
+from .metrics import S3_SECONDS
+from .timing import timed
+
+logger = logging.getLogger(__name__)
 
 
 # ======================================================
@@ -36,7 +53,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 # JWT TOKEN CREATION UTILITY
 # ======================================================
 def create_tokens_for_user(user):
-    refresh = RefreshToken.for_user(user)
+    # same claims as the login endpoint; StatelessJWTAuthentication relies on them
+    refresh = CustomTokenObtainPairSerializer.get_token(user)
     return {
         "refresh": str(refresh),
         "access": str(refresh.access_token),
@@ -44,68 +62,367 @@ def create_tokens_for_user(user):
 
 
 # ======================================================
-# S3 UPLOAD HELPER (public-read)
+# SHARED S3 CLIENT (one per worker process)
 # ======================================================
-def upload_to_s3(file_obj, folder="categories"):
-    """
-    Uploads file to S3 and returns CloudFront URL if configured.
-    """
-    s3 = boto3.client(
-        "s3",
+# Building a client re-resolves credentials, endpoints and the botocore
+# loader (tens to hundreds of ms), so each process builds one lazily and
+# reuses it. Clients are thread-safe and keep a pooled HTTP connection.
+_s3_client = None
+_s3_client_pid = None
+_s3_client_lock = threading.Lock()
+
+
+def build_s3_client():
+    session = boto3.session.Session(
         aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
         aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
         region_name=settings.AWS_S3_REGION_NAME,
     )
+    return session.client(
+        "s3",
+        endpoint_url=settings.AWS_S3_ENDPOINT_URL or None,
+        config=Config(
+            max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+            connect_timeout=5,
+            read_timeout=60,
+            retries={"max_attempts": 3, "mode": "standard"},
+        ),
+    )
 
-    file_ext = file_obj.name.split(".")[-1]
-    unique_name = f"{uuid4()}.{file_ext}"
-    file_key = f"{folder}/{unique_name}"
 
-    s3.upload_fileobj(
-        Fileobj=file_obj,
-        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-        Key=file_key,
-        ExtraArgs={"ContentType": file_obj.content_type}
+def get_s3_client():
+    global _s3_client, _s3_client_pid
+
+    # rebuilt after fork: sockets must not be shared with the parent
+    if _s3_client is None or _s3_client_pid != os.getpid():
+        with _s3_client_lock:
+            if _s3_client is None or _s3_client_pid != os.getpid():
+                _s3_client = build_s3_client()
+                _s3_client_pid = os.getpid()
+    return _s3_client
+
+
+def get_transfer_config():
+    """Multipart / concurrency settings for upload_fileobj."""
+    return TransferConfig(
+        multipart_threshold=settings.AWS_S3_MULTIPART_THRESHOLD,
+        multipart_chunksize=settings.AWS_S3_MULTIPART_CHUNKSIZE,
+        max_concurrency=settings.AWS_S3_MAX_CONCURRENCY,
+        use_threads=True,
     )
 
-    # 🔥 Use CloudFront URL if configured
+
+def build_public_url(file_key):
+    """CloudFront URL if configured, plain S3 URL otherwise."""
     cdn = getattr(settings, "CLOUDFRONT_URL", "").rstrip("/")
     if cdn:
         return f"{cdn}/{file_key}"
 
-    # fallback to S3
     bucket = settings.AWS_STORAGE_BUCKET_NAME
     region = settings.AWS_S3_REGION_NAME
     return f"https://{bucket}.s3.{region}.amazonaws.com/{file_key}"
 
 
-def delete_from_s3(file_url):
+# ======================================================
+# S3 UPLOAD HELPER (public-read)
+# ======================================================
+@contextmanager
+def s3_call(operation):
+    """Times an S3 call for Server-Timing and the s3_operation_duration_seconds histogram."""
+    with timed("s3"), S3_SECONDS.labels(operation).time():
+        yield
+
+
+def new_s3_key(folder, filename):
+    file_ext = filename.split(".")[-1]
+    unique_name = f"{uuid4()}.{file_ext}"
+    return f"{folder}/{unique_name}"
+
+
+def upload_to_s3(file_obj, folder="categories", file_key=None):
     """
-    Deletes a file from S3 using its full URL.
+    Uploads file to S3 and returns CloudFront URL if configured.
+    """
+    file_key = file_key or new_s3_key(folder, file_obj.name)
+
+    with s3_call("upload_fileobj"):
+        get_s3_client().upload_fileobj(
+            Fileobj=file_obj,
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=file_key,
+            ExtraArgs={"ContentType": file_obj.content_type},
+            Config=get_transfer_config(),
+        )
+
+    return build_public_url(file_key)
+
+
+def upload_bytes_to_s3(data, file_key, content_type):
+    with s3_call("put_object"):
+        get_s3_client().put_object(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=file_key,
+            Body=data,
+            ContentType=content_type,
+        )
+    return build_public_url(file_key)
+
+
+def presign_upload(file_key, content_type, max_bytes, method="post"):
+    """
+    Let a browser upload `file_key` straight to the bucket.
+    POST enforces the content type and size; PUT only the content type,
+    so PUT uploads must be size-checked on confirm.
+    """
+    client = get_s3_client()
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+    expires = settings.DIRECT_UPLOAD_EXPIRES
+
+    if method == "put":
+        url = client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": bucket, "Key": file_key, "ContentType": content_type},
+            ExpiresIn=expires,
+        )
+        return {"method": "PUT", "url": url, "headers": {"Content-Type": content_type}}
+
+    post = client.generate_presigned_post(
+        Bucket=bucket,
+        Key=file_key,
+        Fields={"Content-Type": content_type},
+        Conditions=[{"Content-Type": content_type}, ["content-length-range", 1, max_bytes]],
+        ExpiresIn=expires,
+    )
+    return {"method": "POST", "url": post["url"], "fields": post["fields"]}
+
+
+def head_s3_object(file_key):
+    """HEAD response for `file_key`, or None when it does not exist."""
+    client = get_s3_client()
+    try:
+        with s3_call("head_object"):
+            return client.head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=file_key)
+    except client.exceptions.ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+
+
+def read_s3_object(file_key):
+    with s3_call("get_object"):
+        response = get_s3_client().get_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=file_key)
+        return response["Body"].read()
+
+
+def key_from_url(file_url):
+    """
+    Object key for a URL built by build_public_url (CloudFront or S3,
+    virtual-hosted or path style). None when the URL is not in our bucket.
     """
     if not file_url:
+        return None
+
+    parsed = urlparse(file_url)
+    host = parsed.netloc
+    path = unquote(parsed.path).lstrip("/")
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+
+    cdn = urlparse(getattr(settings, "CLOUDFRONT_URL", ""))
+    if cdn.netloc and host == cdn.netloc:
+        prefix = cdn.path.strip("/")
+        if prefix:
+            if not path.startswith(f"{prefix}/"):
+                return None
+            path = path[len(prefix) + 1:]
+        return path or None
+
+    # https://<bucket>.s3.<region>.amazonaws.com/<key>
+    if host.startswith(f"{bucket}.s3") and host.endswith(".amazonaws.com"):
+        return path or None
+
+    # https://s3.<region>.amazonaws.com/<bucket>/<key> or a local endpoint
+    endpoint = urlparse(settings.AWS_S3_ENDPOINT_URL)
+    path_style = (host.startswith("s3") and host.endswith(".amazonaws.com")) or (
+        endpoint.netloc and host == endpoint.netloc
+    )
+    if path_style and path.startswith(f"{bucket}/"):
+        return path[len(bucket) + 1:] or None
+
+    return None
+
+
+def delete_from_s3(file_url):
+    """
+    Deletes a file from S3 right away using its full URL.
+    Views queue deletions instead (api.s3_deletions.delete_image_files).
+    """
+    key = key_from_url(file_url)
+    if not key:
         return
 
-    # Example: https://bucket.s3.us-east-2.amazonaws.com/categories/uuid.jpg
     try:
-        bucket_name = settings.AWS_STORAGE_BUCKET_NAME
-        region = settings.AWS_S3_REGION_NAME
+        with s3_call("delete_object"):
+            get_s3_client().delete_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
+    except Exception:
+        logger.exception("S3 delete failed for %s", key)
+
+
+# ======================================================
+# IMAGE DERIVATIVES (resized variants next to the original)
+# ======================================================
+# Resizing is CPU bound, so it runs in a small per-worker process pool
+# ("spawn": the parent has boto3 threads running). IMAGE_VARIANT_WORKERS=0
+# resizes inline instead.
+_image_pool = None
+_image_pool_pid = None
+# batch uploads resize from several threads at once
+_image_pool_lock = threading.Lock()
+
+
+def _get_image_pool():
+    global _image_pool, _image_pool_pid
+
+    if _image_pool is None or _image_pool_pid != os.getpid():
+        with _image_pool_lock:
+            if _image_pool is None or _image_pool_pid != os.getpid():
+                _image_pool = ProcessPoolExecutor(
+                    max_workers=settings.IMAGE_VARIANT_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                _image_pool_pid = os.getpid()
+    return _image_pool
+
+
+def _reset_image_pool():
+    global _image_pool
+
+    with _image_pool_lock:
+        if _image_pool is not None:
+            _image_pool.shutdown(wait=False, cancel_futures=True)
+        _image_pool = None
+
+
+def start_variants(data):
+    """
+    Start resizing the encoded image in `data`, in the pool unless
+    IMAGE_VARIANT_WORKERS=0. Returns a job for upload_variants().
+    """
+    image_format = images.resolve_format(settings.IMAGE_VARIANT_FORMAT)
+    future = None
+    if settings.IMAGE_VARIANT_WORKERS > 0:
+        future = _get_image_pool().submit(
+            images.render_variants,
+            data, settings.IMAGE_VARIANT_WIDTHS, image_format, settings.IMAGE_VARIANT_QUALITY,
+        )
+    return data, image_format, future
 
-        prefix = f"https://{bucket_name}.s3.{region}.amazonaws.com/"
-        if file_url.startswith(prefix):
-            key = file_url.replace(prefix, "")
+
+def upload_variants(file_key, job):
+    """
+    Wait for a start_variants() job and upload each variant next to
+    `file_key`. Returns {"320w": url, ...} - the map is srcset ready.
+    Render and upload failures are logged and leave those widths out.
+    """
+    data, image_format, future = job
+    try:
+        if future:
+            rendered = future.result(timeout=60)
         else:
-            # fallback
-            key = file_url.split(".amazonaws.com/")[-1]
-
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=region,
+            rendered = images.render_variants(
+                data, settings.IMAGE_VARIANT_WIDTHS, image_format, settings.IMAGE_VARIANT_QUALITY
+            )
+    except BrokenProcessPool:
+        # a worker died; build a fresh pool on the next upload
+        _reset_image_pool()
+        logger.exception("Image variants for %s failed: process pool broken", file_key)
+        rendered = []
+    except Exception:
+        logger.exception("Image variants for %s failed", file_key)
+        rendered = []
+
+    stem = file_key.rsplit(".", 1)[0]
+    extension = images.EXTENSIONS[image_format]
+    content_type = images.CONTENT_TYPES[image_format]
+
+    variants = {}
+    for width, variant in rendered:
+        variant_key = f"{stem}_w{width}.{extension}"
+        try:
+            variants[f"{width}w"] = upload_bytes_to_s3(variant, variant_key, content_type)
+        except Exception:
+            logger.exception("Uploading image variant %s failed", variant_key)
+
+    if len(variants) < len(rendered):
+        # the original is still served; srcset just lacks the missing widths
+        logger.warning(
+            "Stored %d of %d image variants for %s", len(variants), len(rendered), file_key
         )
+    return variants
+
+
+def store_image(file_obj, folder):
+    """
+    Upload the original plus width-bounded variants.
+    Returns (original url, {"320w": url, ...}).
+    """
+    data = file_obj.read()
+    file_obj.seek(0)
+
+    # resize in the pool while the original uploads
+    job = start_variants(data)
+    file_key = new_s3_key(folder, file_obj.name)
+    url = upload_to_s3(file_obj, folder=folder, file_key=file_key)
+
+    return url, upload_variants(file_key, job)
 
-        s3.delete_object(Bucket=bucket_name, Key=key)
 
-    except Exception as e:
-        print("Error deleting from S3:", e)
+# Direct uploads never pass through the worker: their variants are built
+# after the response, on one background thread per process.
+_variant_thread = None
+_variant_thread_pid = None
+_variant_thread_lock = threading.Lock()
+
+
+def _get_variant_thread():
+    global _variant_thread, _variant_thread_pid
+
+    with _variant_thread_lock:
+        if _variant_thread is None or _variant_thread_pid != os.getpid():
+            _variant_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-variants")
+            _variant_thread_pid = os.getpid()
+        return _variant_thread
+
+
+def store_variants_later(file_key, save):
+    """
+    Read `file_key` back from S3, upload its variants and call
+    save(variants), all in the background. Returns the future.
+    """
+    def run():
+        try:
+            save(upload_variants(file_key, start_variants(read_s3_object(file_key))))
+        except Exception:
+            logger.exception("Image variants for %s failed", file_key)
+        finally:
+            connections.close_all()
+
+    return _get_variant_thread().submit(run)
+
+
+def store_images(files, folder):
+    """
+    store_image() for many files at once from a bounded thread pool
+    (GALLERY_UPLOAD_WORKERS). Returns one result per file, in order:
+    (url, variants) on success or the raised exception.
+    """
+    def store(file_obj):
+        try:
+            return store_image(file_obj, folder)
+        except Exception as e:
+            return e
+
+    workers = max(1, min(settings.GALLERY_UPLOAD_WORKERS, len(files)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # each file runs in a copy of the request context so its S3 time is recorded
+        futures = [pool.submit(contextvars.copy_context().run, store, file_obj) for file_obj in files]
+        return [future.result() for future in futures]
@@ -1,19 +1,20 @@
 # api/views.py
 from rest_framework import viewsets
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 
-from django.core.mail import send_mail
 from django.contrib.auth import get_user_model, authenticate
-from django.utils import timezone
 from django.conf import settings
-from .utils import upload_to_s3, delete_from_s3
-from django.db import connection
-import random
+from django.db import transaction
+from .s3_deletions import delete_image_files
+from .utils import store_image
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.crypto import constant_time_compare
 import uuid
-from datetime import timedelta
 
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
@@ -34,31 +35,53 @@ from .serializers import (
     GalleryImageSerializer,
 )
 from .utils import CustomTokenObtainPairSerializer, create_tokens_for_user
+from .bootstrap import site_bootstrap
+from .caching import cache_stats
+from .filters import filter_gallery, parse_date_range
+from .health import readiness
+from .mail import queue_email
+from .metrics import OTP_ISSUED, OTP_VERIFICATIONS, render_metrics
+from .otp import OTP_INVALID, OTP_LOCKED, OTP_MISSING, OTP_OK, generate_otp, get_otp_store
+from .mixins import (
+    CachedListMixin,
+    CacheInvalidationMixin,
+    ConditionalGetMixin,
+    CursorPaginationMixin,
+    DirectUploadMixin,
+    FastListMixin,
+    GalleryBatchUploadMixin,
+    RegistrationBulkStatusMixin,
+    RegistrationExportMixin,
+    RegistrationFilterMixin,
+    RegistrationImportMixin,
+    SparseFieldsMixin,
+)
+from .stats import BUCKET_DAY, REGISTRATION_KINDS, registration_stats
+
+# =====================================================================
+# HEALTH CHECKS
+# =====================================================================
 
 @api_view(['GET'])
+@authentication_classes([])
 @permission_classes([AllowAny])
-def health_check(request):
+def liveness_check(request):
+    """The process is up and serving requests. Never touches the database."""
+    return Response({"status": "ok"})
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def readiness_check(request):
     """
-    Simple health check for EB Load Balancer / CloudFront.
-    Tests:
-      - Django app running
-      - Database connection working
+    Database (and optionally cache backend / S3) reachable, with per-check
+    latency. Results are cached per worker for HEALTH_CHECK_CACHE_SECONDS
+    and each check is bounded by HEALTH_CHECK_TIMEOUT (api.health).
+    Also served at /api/health/ for the existing load balancer probe.
     """
-    # Check DB connection
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1;")
-        db_status = "ok"
-    except Exception as e:
-        return Response({
-            "status": "error",
-            "db": str(e),
-        }, status=500)
-
-    return Response({
-        "status": "ok",
-        "db": db_status,
-    })
+    ok, checks = readiness()
+    return Response({"status": "ok" if ok else "error", "checks": checks}, status=200 if ok else 503)
 
 
 
@@ -137,12 +160,11 @@ def create_team_user(request):
     frontend = settings.FRONTEND_URL.rstrip("/")
     setup_link = f"{frontend}/create-password?token={token_obj.token}"
 
-    # Send email
-    send_mail(
+    # Queue email (sent by the outbox worker)
+    queue_email(
         "Set Your Password",
         f"Hello {name},\nUse this link to set your password:\n{setup_link}\nThis link expires in 24 hours.",
-        "no-reply@yourapp.com",
-        [email]
+        [email],
     )
 
     return Response({
@@ -191,8 +213,25 @@ def delete_team_user(request, user_id):
 # OTP FLOW (Improved)
 # =====================================================================
 
-# OTP_STORE = { email: { "otp": 123456, "created_at": datetime } }
-OTP_STORE = {}
+# Codes live in the configured OTPStore (settings.OTP_STORE_BACKEND), so
+# every gunicorn worker sees the same codes and attempt counters.
+
+OTP_ERRORS = {
+    OTP_MISSING: ({"detail": "OTP not found or expired"}, 400),
+    OTP_INVALID: ({"detail": "Invalid OTP"}, 400),
+    OTP_LOCKED: ({"detail": "Too many attempts, request a new OTP"}, 429),
+}
+
+
+def _check_otp(email, otp):
+    """Returns an error Response, or None when the OTP is valid."""
+    result = get_otp_store().check(email, otp)
+    OTP_VERIFICATIONS.labels(result).inc()
+    if result == OTP_OK:
+        return None
+
+    body, status = OTP_ERRORS[result]
+    return Response(body, status=status)
 
 
 @api_view(['POST'])
@@ -214,17 +253,14 @@ def send_otp(request):
         return Response({"detail": "Email does not match invitation"}, status=403)
 
     # Generate OTP
-    otp = random.randint(100000, 999999)
-    OTP_STORE[email] = {
-        "otp": otp,
-        "created_at": timezone.now()
-    }
+    otp = generate_otp()
+    get_otp_store().issue(email, otp)
+    OTP_ISSUED.inc()
 
-    send_mail(
+    queue_email(
         "Your OTP Code",
-        f"Your OTP is {otp}. It expires in 5 minutes.",
-        "no-reply@yourapp.com",
-        [email]
+        f"Your OTP is {otp}. It expires in {settings.OTP_TTL_SECONDS // 60} minutes.",
+        [email],
     )
 
     return Response({"message": "OTP sent"})
@@ -239,18 +275,9 @@ def verify_otp(request):
     if not email or not otp:
         return Response({"detail": "Email & OTP required"}, status=400)
 
-    entry = OTP_STORE.get(email)
-
-    if not entry:
-        return Response({"detail": "OTP not found"}, status=400)
-
-    # Check expiry
-    if timezone.now() > entry["created_at"] + timedelta(minutes=5):
-        OTP_STORE.pop(email, None)
-        return Response({"detail": "OTP expired"}, status=400)
-
-    if entry["otp"] != int(otp):
-        return Response({"detail": "Invalid OTP"}, status=400)
+    error = _check_otp(email, otp)
+    if error:
+        return error
 
     return Response({"message": "OTP verified"})
 
@@ -283,16 +310,9 @@ def create_password(request):
         return Response({"detail": "Missing required fields (email, otp, password, token, username)"}, status=400)
 
     # OTP VALIDATION
-    entry = OTP_STORE.get(email)
-    if not entry:
-        return Response({"detail": "OTP not found"}, status=400)
-
-    if timezone.now() > entry["created_at"] + timedelta(minutes=5):
-        OTP_STORE.pop(email, None)
-        return Response({"detail": "OTP expired"}, status=400)
-
-    if entry["otp"] != int(otp):
-        return Response({"detail": "Invalid OTP"}, status=400)
+    error = _check_otp(email, otp)
+    if error:
+        return error
 
     # TOKEN VALIDATION (1 DAY)
     try:
@@ -320,7 +340,7 @@ def create_password(request):
     user.save()
 
     # Cleanup
-    OTP_STORE.pop(email, None)
+    get_otp_store().discard(email)
     token_obj.delete()
 
     # Optionally return tokens immediately so frontend can redirect/log in
@@ -415,98 +435,279 @@ def team_login(request):
     })
 
 
+# =====================================================================
+# DASHBOARD STATS (grouped COUNTs, cached per registration version)
+# =====================================================================
+
+def _stats_params(request):
+    date_from, date_to = parse_date_range(request.query_params)
+
+    bucket = request.query_params.get("bucket") or None
+    if bucket not in (None, BUCKET_DAY):
+        raise ValidationError({"bucket": f"Supported buckets: {BUCKET_DAY}"})
+
+    return date_from, date_to, bucket
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def registration_stats_summary(request):
+    """
+    Funnel counts for exhibitors and visitors in one response.
+    Optional: ?date_from=YYYY-MM-DD&date_to=YYYY-MM-DD&bucket=day
+    """
+    params = _stats_params(request)
+    return Response({kind: registration_stats(kind, *params) for kind in REGISTRATION_KINDS})
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def registration_stats_detail(request, kind):
+    """Funnel counts for a single registration kind (exhibitors / visitors)."""
+    if kind not in REGISTRATION_KINDS:
+        return Response({"detail": "Unknown stats type"}, status=404)
+
+    return Response(registration_stats(kind, *_stats_params(request)))
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def public_bootstrap(request):
+    """
+    Active event, categories and carousel / banner images for the public
+    site in one response, served from a cached pre-encoded blob.
+    """
+    blob, etag, hit = site_bootstrap()
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(blob, content_type="application/json")
+        response["X-Cache"] = "HIT" if hit else "MISS"
+    response["ETag"] = etag
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def response_cache_stats(request):
+    """Hit / miss counters of the public list response cache, per model."""
+    return Response(cache_stats())
+
+
+# =====================================================================
+# PROMETHEUS METRICS
+# =====================================================================
+
+def prometheus_metrics(request):
+    """
+    Prometheus text format. Plain Django view (no DRF auth / negotiation);
+    the scraper sends METRICS_TOKEN as a Bearer token. Without a token the
+    endpoint is only open when DEBUG is on.
+    """
+    if not settings.METRICS_TOKEN and not settings.DEBUG:
+        return HttpResponse("Set METRICS_TOKEN to enable metrics", status=403, content_type="text/plain")
+    if settings.METRICS_TOKEN:
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not constant_time_compare(supplied, settings.METRICS_TOKEN):
+            return HttpResponse("Unauthorized", status=401, content_type="text/plain")
+
+    body, content_type = render_metrics()
+    response = HttpResponse(body, content_type=content_type)
+    patch_cache_control(response, no_store=True)
+    return response
+
+
 # =====================================================================
 # CRUD VIEWSETS
 # =====================================================================
 
-class ExhibitorRegistrationViewSet(viewsets.ModelViewSet):
+class ExhibitorRegistrationViewSet(
+    ConditionalGetMixin,
+    RegistrationImportMixin,
+    RegistrationBulkStatusMixin,
+    RegistrationExportMixin,
+    RegistrationFilterMixin,
+    CursorPaginationMixin,
+    CacheInvalidationMixin,
+    SparseFieldsMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
 
     queryset = ExhibitorRegistration.objects.all().order_by('-created_at')
     serializer_class = ExhibitorRegistrationSerializer
     permission_classes = [AllowAny]
 
+    category_field = "product_category"
+    stats_kind = "exhibitors"
+    export_filename = "exhibitors"
+    export_fields = (
+        "id",
+        "company_name",
+        "contact_person_name",
+        "designation",
+        "email_address",
+        "contact_number",
+        "product_category",
+        "company_address",
+        "status",
+        "created_at",
+        "updated_at",
+    )
+
 
-class VisitorRegistrationViewSet(viewsets.ModelViewSet):
+class VisitorRegistrationViewSet(
+    ConditionalGetMixin,
+    RegistrationImportMixin,
+    RegistrationBulkStatusMixin,
+    RegistrationExportMixin,
+    RegistrationFilterMixin,
+    CursorPaginationMixin,
+    CacheInvalidationMixin,
+    SparseFieldsMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = VisitorRegistration.objects.all().order_by('-created_at')
     serializer_class = VisitorRegistrationSerializer
     permission_classes = [AllowAny]
 
+    category_field = "industry_interest"
+    stats_kind = "visitors"
+    export_filename = "visitors"
+    export_fields = (
+        "id",
+        "first_name",
+        "last_name",
+        "company_name",
+        "email_address",
+        "phone_number",
+        "industry_interest",
+        "status",
+        "created_at",
+        "updated_at",
+    )
+
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(
+    ConditionalGetMixin,
+    DirectUploadMixin,
+    CachedListMixin,
+    CacheInvalidationMixin,
+    SparseFieldsMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Category.objects.all().order_by('-created_at')
     serializer_class = CategorySerializer
     parser_classes = (MultiPartParser, FormParser)
     permission_classes = [AllowAny]
+    upload_folder = "categories"
 
     http_method_names = ['get', 'post', 'delete']
 
     def create(self, request, *args, **kwargs):
         data = request.data.copy()
 
+        variants = {}
         file_obj = request.FILES.get("image")
         if file_obj:
-            url = upload_to_s3(file_obj, folder="categories")
+            url, variants = store_image(file_obj, folder="categories")
             data["image"] = url
 
         serializer = self.get_serializer(data=data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        self.perform_create(serializer, image_variants=variants)
         return Response(serializer.data)
 
     def perform_destroy(self, instance):
         if instance.image:
-            delete_from_s3(instance.image)
-        instance.delete()
-
-
-class EventViewSet(viewsets.ModelViewSet):
+            delete_image_files(instance.image, instance.image_variants)
+        super().perform_destroy(instance)
+
+
+class EventViewSet(
+    ConditionalGetMixin,
+    CachedListMixin,
+    CacheInvalidationMixin,
+    SparseFieldsMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Event.objects.all().order_by('-start_date')
     serializer_class = EventSerializer
     permission_classes = [AllowAny]
 
 
-class GalleryImageViewSet(viewsets.ModelViewSet):
-    queryset = GalleryImage.objects.all().order_by('-created_at')
+class GalleryImageViewSet(
+    ConditionalGetMixin,
+    DirectUploadMixin,
+    GalleryBatchUploadMixin,
+    CachedListMixin,
+    CursorPaginationMixin,
+    CacheInvalidationMixin,
+    SparseFieldsMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
+    # display order first; served by gallery_order_idx / gallery_type_order_idx
+    queryset = GalleryImage.objects.all().order_by('display_order', '-created_at', '-id')
     serializer_class = GalleryImageSerializer
     parser_classes = (MultiPartParser, FormParser)
     permission_classes = [AllowAny]
+    upload_folder = "gallery"
+    keyset_ordering = ("display_order", "-created_at", "-id")
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action == "list":
+            queryset = filter_gallery(queryset, self.request.query_params)
+        return queryset
 
     def create(self, request, *args, **kwargs):
         data = request.data.copy()
 
+        variants = {}
         file_obj = request.FILES.get("image")
         if file_obj:
-            url = upload_to_s3(file_obj, folder="gallery")
+            url, variants = store_image(file_obj, folder="gallery")
             data["image"] = url
 
         serializer = self.get_serializer(data=data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        self.perform_create(serializer, image_variants=variants)
         return Response(serializer.data)
 
     def update(self, request, *args, **kwargs):
         instance = self.get_object()
         data = request.data.copy()
 
+        save_kwargs = {}
         file_obj = request.FILES.get("image")
 
+        old_files = None
         if file_obj:
-            # delete old image
             if instance.image:
-                delete_from_s3(instance.image)
+                old_files = (instance.image, instance.image_variants)
 
             # upload new one
-            url = upload_to_s3(file_obj, folder="gallery")
+            url, save_kwargs["image_variants"] = store_image(file_obj, folder="gallery")
             data["image"] = url
 
         serializer = self.get_serializer(instance, data=data, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        self.perform_update(serializer, **save_kwargs)
+
+        if old_files:
+            # delete old image and its variants once the row points at the new one
+            transaction.on_commit(lambda: delete_image_files(*old_files))
         return Response(serializer.data)
 
     def perform_destroy(self, instance):
         if instance.image:
-            delete_from_s3(instance.image)
-        instance.delete()
+            delete_image_files(instance.image, instance.image_variants)
+        super().perform_destroy(instance)
 
 
@@ -43,6 +43,9 @@ AUTH_USER_MODEL = "api.User"
 # MIDDLEWARE
 # ==============================================
 MIDDLEWARE = [
+    # outermost, so its total covers every other middleware
+    "api.timing.ServerTimingMiddleware",
+    "api.metrics.PrometheusMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
 
@@ -174,6 +177,42 @@ AWS_S3_REGION_NAME = config("AWS_S3_REGION_NAME")
 AWS_S3_CUSTOM_DOMAIN = config("AWS_S3_CUSTOM_DOMAIN")
 AWS_LOCATION = config("AWS_LOCATION")
 
+# Point at a local S3 stand-in (moto server, MinIO) in development
+AWS_S3_ENDPOINT_URL = config("AWS_S3_ENDPOINT_URL", default="")
+
+# Shared boto3 client / transfer tuning (api/utils.py)
+AWS_S3_MAX_POOL_CONNECTIONS = config("AWS_S3_MAX_POOL_CONNECTIONS", default=20, cast=int)
+AWS_S3_MULTIPART_THRESHOLD = config("AWS_S3_MULTIPART_THRESHOLD", default=8 * 1024 * 1024, cast=int)
+AWS_S3_MULTIPART_CHUNKSIZE = config("AWS_S3_MULTIPART_CHUNKSIZE", default=8 * 1024 * 1024, cast=int)
+AWS_S3_MAX_CONCURRENCY = config("AWS_S3_MAX_CONCURRENCY", default=8, cast=int)
+
+# Resized variants generated for category / gallery uploads (api.utils.store_image)
+IMAGE_VARIANT_WIDTHS = tuple(
+    int(w) for w in config("IMAGE_VARIANT_WIDTHS", default="320,640,1280").split(",") if w.strip()
+)
+IMAGE_VARIANT_FORMAT = config("IMAGE_VARIANT_FORMAT", default="WEBP")  # WEBP / AVIF / JPEG
+IMAGE_VARIANT_QUALITY = config("IMAGE_VARIANT_QUALITY", default=80, cast=int)
+IMAGE_VARIANT_WORKERS = config("IMAGE_VARIANT_WORKERS", default=2, cast=int)
+
+# Deferred deletions (api.s3_deletions): queued in PendingS3Deletion and
+# removed with DeleteObjects by a background thread / flush_s3_deletions
+S3_DELETE_BATCH_SIZE = config("S3_DELETE_BATCH_SIZE", default=1000, cast=int)
+S3_DELETE_IN_BACKGROUND = config("S3_DELETE_IN_BACKGROUND", default=True, cast=bool)
+S3_DELETE_RETRY_BASE_DELAY = config("S3_DELETE_RETRY_BASE_DELAY", default=60, cast=int)  # seconds
+S3_DELETE_RETRY_MAX_DELAY = config("S3_DELETE_RETRY_MAX_DELAY", default=3600, cast=int)  # seconds
+
+# Browser -> S3 uploads (upload-url / confirm-upload on categories and gallery)
+DIRECT_UPLOAD_MAX_BYTES = config("DIRECT_UPLOAD_MAX_BYTES", default=10 * 1024 * 1024, cast=int)
+DIRECT_UPLOAD_CONTENT_TYPES = tuple(
+    config("DIRECT_UPLOAD_CONTENT_TYPES", default="image/jpeg,image/png,image/webp,image/gif,image/avif").split(",")
+)
+DIRECT_UPLOAD_EXPIRES = config("DIRECT_UPLOAD_EXPIRES", default=900, cast=int)  # presigned URL lifetime, seconds
+DIRECT_UPLOAD_CONFIRM_MAX_AGE = config("DIRECT_UPLOAD_CONFIRM_MAX_AGE", default=3600, cast=int)  # seconds
+
+# POST /api/gallery/batch/
+GALLERY_BATCH_MAX_FILES = config("GALLERY_BATCH_MAX_FILES", default=200, cast=int)
+GALLERY_UPLOAD_WORKERS = config("GALLERY_UPLOAD_WORKERS", default=8, cast=int)
+
 
 # Only enable S3 if bucket is provided
 if AWS_STORAGE_BUCKET_NAME:
@@ -194,8 +233,9 @@ AWS_S3_OBJECT_PARAMETERS = {"CacheControl": "max-age=86400"}
 # REST FRAMEWORK
 # ==============================================
 REST_FRAMEWORK = {
+    # request.user comes from the token claims, not a User query
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "api.authentication.StatelessJWTAuthentication",
     ),
 
     # DEFAULT = PUBLIC unless view overrides it
@@ -217,16 +257,125 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Revocation latency of stateless JWT auth. Access tokens stop working as
+# soon as User.save() deactivates or User.delete() removes the user (on
+# every worker, with a shared cache). Everything else, including
+# QuerySet.update(is_active=False), QuerySet.delete() and a cache that is
+# not shared or evicted the deletion marker, applies within this many
+# seconds (LOCAL_CACHE_MAX_TIMEOUT with a per-process cache).
+AUTH_REVOKED_USERS_TTL = config("AUTH_REVOKED_USERS_TTL", default=30, cast=int)
+
 
 # ==============================================
 # EMAIL CONFIG
 # ==============================================
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
-EMAIL_HOST = "smtp.gmail.com"
-EMAIL_PORT = 587
-EMAIL_USE_TLS = True
+EMAIL_BACKEND = config("EMAIL_BACKEND", default="django.core.mail.backends.smtp.EmailBackend")
+EMAIL_HOST = config("EMAIL_HOST", default="smtp.gmail.com")
+EMAIL_PORT = config("EMAIL_PORT", default=587, cast=int)
+EMAIL_USE_TLS = config("EMAIL_USE_TLS", default=True, cast=bool)
 EMAIL_HOST_USER = config("EMAIL_HOST_USER", default="")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD", default="")
+EMAIL_TIMEOUT = config("EMAIL_TIMEOUT", default=30, cast=int)
+DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", default="no-reply@yourapp.com")
+
+# Outbox worker (manage.py send_queued_email)
+EMAIL_QUEUE_BATCH_SIZE = config("EMAIL_QUEUE_BATCH_SIZE", default=50, cast=int)
+EMAIL_MAX_ATTEMPTS = config("EMAIL_MAX_ATTEMPTS", default=6, cast=int)
+EMAIL_RETRY_BASE_DELAY = config("EMAIL_RETRY_BASE_DELAY", default=30, cast=int)  # seconds
+EMAIL_RETRY_MAX_DELAY = config("EMAIL_RETRY_MAX_DELAY", default=3600, cast=int)  # seconds
+
+
+# ==============================================
+# CACHE
+# ==============================================
+# Local memory by default. Production (several gunicorn workers) needs a
+# shared backend, e.g. django.core.cache.backends.redis.RedisCache: a
+# write only bumps the cache versions of the workers that share it.
+# With a process-local backend every cached payload is kept at most
+# LOCAL_CACHE_MAX_TIMEOUT seconds, and `manage.py check` reports it
+# (an error when DEBUG is off).
+CACHES = {
+    "default": {
+        "BACKEND": config("CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": config("CACHE_LOCATION", default="igtf-default"),
+    }
+}
+
+LOCAL_CACHE_MAX_TIMEOUT = config("LOCAL_CACHE_MAX_TIMEOUT", default=5, cast=int)
+
+# Seconds to keep aggregate dashboard stats (writes invalidate immediately
+# with a shared cache)
+STATS_CACHE_TIMEOUT = config("STATS_CACHE_TIMEOUT", default=300, cast=int)
+
+# Seconds to keep public list responses (categories / events / gallery)
+RESPONSE_CACHE_TIMEOUT = config("RESPONSE_CACHE_TIMEOUT", default=3600, cast=int)
+
+
+# ==============================================
+# OTP (password setup)
+# ==============================================
+# api.otp.DatabaseOTPStore works across workers out of the box;
+# api.otp.CacheOTPStore needs a shared CACHE_BACKEND (e.g. Redis).
+OTP_STORE_BACKEND = config("OTP_STORE_BACKEND", default="api.otp.DatabaseOTPStore")
+OTP_TTL_SECONDS = config("OTP_TTL_SECONDS", default=300, cast=int)
+OTP_MAX_ATTEMPTS = config("OTP_MAX_ATTEMPTS", default=5, cast=int)
+
+
+# ==============================================
+# EXPORTS / BULK ACTIONS
+# ==============================================
+# Rows fetched per round trip when streaming CSV / NDJSON exports
+EXPORT_CHUNK_SIZE = config("EXPORT_CHUNK_SIZE", default=2000, cast=int)
+
+# Upper bound on rows touched by one bulk status update
+BULK_STATUS_MAX_ROWS = config("BULK_STATUS_MAX_ROWS", default=5000, cast=int)
+
+# CSV imports: rows per INSERT batch / rejected rows listed in the report
+IMPORT_BATCH_SIZE = config("IMPORT_BATCH_SIZE", default=500, cast=int)
+IMPORT_MAX_REPORTED_ERRORS = config("IMPORT_MAX_REPORTED_ERRORS", default=1000, cast=int)
+
+
+# ==============================================
+# REQUEST TIMING / METRICS (Server-Timing, api.timing log, Prometheus)
+# ==============================================
+# Share of requests timed: 1.0 = all, 0 = off. Cheap enough to leave on
+# at a low rate in production.
+SERVER_TIMING_SAMPLE_RATE = config("SERVER_TIMING_SAMPLE_RATE", default=1.0 if DEBUG else 0.05, cast=float)
+
+# /api/metrics/ requires "Authorization: Bearer <token>"; left empty, the
+# endpoint is open with DEBUG on and disabled (403) otherwise.
+# Per-process samples are merged when gunicorn.conf.py sets PROMETHEUS_MULTIPROC_DIR.
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "api": {
+            "handlers": ["console"],
+            "level": config("API_LOG_LEVEL", default="WARNING"),
+        },
+        "api.timing": {
+            "handlers": ["console"],
+            "level": config("SERVER_TIMING_LOG_LEVEL", default="INFO"),
+            "propagate": False,
+        },
+    },
+}
+
+
+# ==============================================
+# HEALTH CHECKS (/api/health/ready/)
+# ==============================================
+# Each worker re-checks a dependency at most this often
+HEALTH_CHECK_CACHE_SECONDS = config("HEALTH_CHECK_CACHE_SECONDS", default=5.0, cast=float)
+# Hard limit per check; a check still running is not started again
+HEALTH_CHECK_TIMEOUT = config("HEALTH_CHECK_TIMEOUT", default=2.0, cast=float)
+HEALTH_CHECK_CACHE_BACKEND = config("HEALTH_CHECK_CACHE_BACKEND", default=True, cast=bool)
+HEALTH_CHECK_S3 = config("HEALTH_CHECK_S3", default=False, cast=bool)
 
 
 # ==============================================
@@ -0,0 +1,42 @@
+# Gunicorn settings (picked up automatically from the working directory).
+# Worker count: WEB_CONCURRENCY, read by gunicorn itself.
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# ==============================================
+# PROMETHEUS MULTIPROCESS MODE
+# ==============================================
+# Every worker writes its metric samples to this directory and
+# /api/metrics/ merges them. It must be set before prometheus_client is
+# imported, i.e. here rather than in Django settings. The Procfile points
+# the email worker at the same directory.
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus-multiproc"
+)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # alive, owned by another user
+    return True
+
+
+def on_starting(server):
+    # samples of processes from a previous run would be added to the new
+    # totals; files of live ones (the email worker) are kept
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+    for name in os.listdir(PROMETHEUS_MULTIPROC_DIR):
+        pid = name.rsplit("_", 1)[-1].removesuffix(".db")
+        if not (pid.isdigit() and _pid_alive(int(pid))):
+            os.remove(os.path.join(PROMETHEUS_MULTIPROC_DIR, name))
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -8,7 +8,9 @@ import { Footer } from "@/components/footer";
 
 
 const BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL;
-const GALLERY_API_URL = `${BASE_URL}/gallery/`;
+// Only the rows this page shows (gallery carousel + tab images); banners and
+// exhibitor images are filtered out by the API instead of downloaded here
+const GALLERY_API_URL = `${BASE_URL}/gallery/?type=carousel,gallery`;
 
 interface GalleryItem {
   id: number;
@@ -1,13 +1,22 @@
 "use client";
 
 import { useState, useEffect, useCallback } from "react";
-import { ExhibitorRegistration, URLS, getAuthHeaders } from "@/utils/api";
+import {
+  ExhibitorRegistration,
+  RegistrationStats,
+  URLS,
+  getAuthHeaders,
+} from "@/utils/api";
 import { toast } from "sonner";
 
 export function useExhibitors() {
   const [exhibitors, setExhibitors] = useState<ExhibitorRegistration[]>([]);
   const [loading, setLoading] = useState(true); // initial fetch loader
   const [isUpdating, setIsUpdating] = useState(false); // update loader
+  const [serverStats, setServerStats] = useState<RegistrationStats | null>(
+    null
+  );
+  const [statsError, setStatsError] = useState<string>("");
 
   const [searchQuery, setSearchQuery] = useState("");
   const [filterStatus, setFilterStatus] = useState<string>("all");
@@ -32,9 +41,29 @@ export function useExhibitors() {
     }
   }, []);
 
+  // Counts come from the server so they cover every page, not just this one
+  const fetchStats = useCallback(async () => {
+    try {
+      setStatsError("");
+      const res = await fetch(`${URLS.STATS}exhibitors/`, {
+        headers: getAuthHeaders(),
+      });
+      if (!res.ok) throw new Error("Failed to fetch stats");
+      setServerStats(await res.json());
+    } catch (err: any) {
+      console.error("Failed to fetch exhibitor stats", err);
+      setStatsError(err.message || "Failed to load exhibitor stats.");
+      setServerStats(null);
+    }
+  }, []);
+
+  const refetch = useCallback(async () => {
+    await Promise.all([fetchExhibitors(), fetchStats()]);
+  }, [fetchExhibitors, fetchStats]);
+
   useEffect(() => {
-    fetchExhibitors();
-  }, [fetchExhibitors]);
+    refetch();
+  }, [refetch]);
 
   // STATUS UPDATE — NO OPTIMISTIC UPDATE
   const updateStatus = async (
@@ -54,7 +83,7 @@ export function useExhibitors() {
 
       toast.success("Status updated successfully");
 
-      await fetchExhibitors(); // wait for fresh backend data
+      await refetch(); // wait for fresh backend data
     } catch (err) {
       toast.error("Failed to update status");
     } finally {
@@ -63,14 +92,17 @@ export function useExhibitors() {
   };
 
   // STATS
+  const countStatus = (status: ExhibitorRegistration["status"]) =>
+    serverStats
+      ? serverStats.by_status[status] ?? 0
+      : exhibitors.filter((e) => e.status === status).length;
+
   const stats = {
-    totalExhibitors: exhibitors.length,
-    paidExhibitors: exhibitors.filter((e) => e.status === "paid").length,
-    contactedExhibitors: exhibitors.filter((e) => e.status === "contacted")
-      .length,
-    pendingExhibitors: exhibitors.filter((e) => e.status === "pending").length,
-    rejectedExhibitors: exhibitors.filter((e) => e.status === "rejected")
-      .length,
+    totalExhibitors: serverStats ? serverStats.total : exhibitors.length,
+    paidExhibitors: countStatus("paid"),
+    contactedExhibitors: countStatus("contacted"),
+    pendingExhibitors: countStatus("pending"),
+    rejectedExhibitors: countStatus("rejected"),
   };
 
   return {
@@ -85,6 +117,7 @@ export function useExhibitors() {
 
     updateStatus,
     stats,
-    refetch: fetchExhibitors,
+    statsError,
+    refetch,
   };
 }
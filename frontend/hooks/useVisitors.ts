@@ -1,13 +1,22 @@
 "use client";
 
 import { useState, useEffect, useCallback } from "react";
-import { VisitorRegistration, URLS, getAuthHeaders } from "@/utils/api";
+import {
+  VisitorRegistration,
+  RegistrationStats,
+  URLS,
+  getAuthHeaders,
+} from "@/utils/api";
 import { toast } from "sonner";
 
 export function useVisitors() {
   const [visitors, setVisitors] = useState<VisitorRegistration[]>([]);
   const [loading, setLoading] = useState(true);
   const [isUpdating, setIsUpdating] = useState(false);
+  const [serverStats, setServerStats] = useState<RegistrationStats | null>(
+    null
+  );
+  const [statsError, setStatsError] = useState<string>("");
 
   const [searchQuery, setSearchQuery] = useState("");
   const [filterStatus, setFilterStatus] = useState<string>("all");
@@ -39,9 +48,29 @@ export function useVisitors() {
     }
   }, []);
 
+  // Counts come from the server so they cover every page, not just this one
+  const fetchStats = useCallback(async () => {
+    try {
+      setStatsError("");
+      const res = await fetch(`${URLS.STATS}visitors/`, {
+        headers: getAuthHeaders(),
+      });
+      if (!res.ok) throw new Error("Failed to fetch stats");
+      setServerStats(await res.json());
+    } catch (err: any) {
+      console.error("Failed to fetch visitor stats", err);
+      setStatsError(err.message || "Failed to load visitor stats.");
+      setServerStats(null);
+    }
+  }, []);
+
+  const refetch = useCallback(async () => {
+    await Promise.all([fetchVisitors(), fetchStats()]);
+  }, [fetchVisitors, fetchStats]);
+
   useEffect(() => {
-    fetchVisitors();
-  }, [fetchVisitors]);
+    refetch();
+  }, [refetch]);
 
   // STATUS UPDATE
   const updateStatus = async (
@@ -64,7 +93,7 @@ export function useVisitors() {
 
       toast.success("Visitor status updated");
 
-      await fetchVisitors();
+      await refetch();
     } catch (err) {
       toast.error("Failed to update visitor status");
     } finally {
@@ -73,12 +102,17 @@ export function useVisitors() {
   };
 
   // STATS
+  const countStatus = (status: VisitorRegistration["status"]) =>
+    serverStats
+      ? serverStats.by_status[status] ?? 0
+      : visitors.filter((v) => v.status === status).length;
+
   const stats = {
-    totalVisitors: visitors.length,
-    pendingVisitors: visitors.filter((v) => v.status === "pending").length,
-    contactedVisitors: visitors.filter((v) => v.status === "contacted").length,
-    paidVisitors: visitors.filter((v) => v.status === "paid").length,
-    rejectedVisitors: visitors.filter((v) => v.status === "rejected").length,
+    totalVisitors: serverStats ? serverStats.total : visitors.length,
+    pendingVisitors: countStatus("pending"),
+    contactedVisitors: countStatus("contacted"),
+    paidVisitors: countStatus("paid"),
+    rejectedVisitors: countStatus("rejected"),
   };
 
   return {
@@ -91,6 +125,7 @@ export function useVisitors() {
     setFilterStatus,
     updateStatus,
     stats,
-    refetch: fetchVisitors,
+    statsError,
+    refetch,
   };
 }
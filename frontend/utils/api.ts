@@ -6,6 +6,8 @@ export const URLS = {
   EVENTS: `${BASE_URL}/events/`,
   CATEGORIES: `${BASE_URL}/categories/`,
   GALLERY: `${BASE_URL}/gallery/`,
+  STATS: `${BASE_URL}/stats/`,
+  BOOTSTRAP: `${BASE_URL}/bootstrap/`,
 };
 
 // --- Helper ---
@@ -21,6 +23,11 @@ export const getAuthHeaders = (): Record<string, string> => {
 };
 
 // --- Interfaces ---
+export interface RegistrationStats {
+  total: number;
+  by_status: Record<"pending" | "contacted" | "paid" | "rejected", number>;
+}
+
 export interface ExhibitorRegistration {
   id: number;
   company_name: string;